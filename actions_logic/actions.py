@@ -3,8 +3,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Optional, Tuple
 import random
 
+from components.condition_types import Condition
 import game_map.color as color
 import utility_files.exceptions as exceptions
+import utility_files.tracing as tracing
 
 if TYPE_CHECKING:
     from game_logic.engine import Engine
@@ -13,11 +15,25 @@ if TYPE_CHECKING:
     #from components.status import confusion_direction
 
 
+def _trace_attributes(action: Action) -> dict:
+    entity = action.entity
+    if not hasattr(entity, "name"):
+        entity = entity.entity  # Some AIs act as the entity of their own actions.
+    return {"actor": entity.name}
+
+
 class Action:
+    __slots__ = ("entity",)
+
     def __init__(self, entity: Actor) -> None:
         super().__init__()
         self.entity = entity
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if "perform" in cls.__dict__:
+            tracing.instrument(cls, "perform", "action", _trace_attributes)
+
     @property
     def engine(self) -> Engine:
         """Return the engine this action belongs to."""
@@ -46,17 +62,16 @@ class PickupAction(Action):
         actor_location_y = self.entity.y
         inventory = self.entity.inventory
 
-        for item in self.engine.game_map.items:
-            if actor_location_x == item.x and actor_location_y == item.y:
-                if len(inventory.items) >= inventory.capacity:
-                    raise exceptions.Impossible("Your inventory is full.")
+        for item in self.engine.game_map.get_items_at_location(actor_location_x, actor_location_y):
+            if len(inventory.items) >= inventory.capacity:
+                raise exceptions.Impossible("Your inventory is full.")
 
-                self.engine.game_map.entities.remove(item)
-                item.parent = self.entity.inventory
-                inventory.items.append(item)
+            self.engine.game_map.remove_entity(item)
+            item.parent = self.entity.inventory
+            inventory.items.append(item)
 
-                self.engine.message_log.add_message(f"You picked up the {item.name}!")
-                return
+            self.engine.message_log.add_message(f"You picked up the {item.name}!")
+            return
 
         raise exceptions.Impossible("There is nothing here to pick up.")
 
@@ -186,8 +201,8 @@ class RangedAction(ActionWithDirection):
 
             # This checks if the player is grabbed and the enemy is dead, and then release the player from the grabbed condition
             if self.entity == self.engine.player and self.entity.status.check_grabbed_condition and (damage > 0 and damage_modificator > 0):
-                if (target.fighter.hp <= 0 or not target.is_alive) and target.status.dict_condition_attack["grab"]:
-                    self.entity.status.dict_condition_afflicted["grab"] = False
+                if (target.fighter.hp <= 0 or not target.is_alive) and target.status.attack & Condition.GRAB:
+                    self.entity.status.cure(Condition.GRAB)
                     self.engine.message_log.add_message(f"You are free from the grab.", color.player_atk)
                     
             # This checks if the player is ingested and the enemy is dead, and then release the player from the ingested condition
@@ -199,6 +214,8 @@ class RangedAction(ActionWithDirection):
             # After the damage, there is the check for the conditions effect.
             self.entity.status.affect_new_status(self, target, color.player_atk)
 
+        self.engine.make_noise(self.entity.x, self.entity.y)
+
 
 class MeleeAction(ActionWithDirection):
     def perform(self) -> None:
@@ -224,7 +241,7 @@ class MeleeAction(ActionWithDirection):
             damage_modificator = target.damage_info.calculate_damage(self.entity.damage_info.attack_type_return())
 
         #if the entity has fear status, it calculate a random chance to hit the opponent
-        if self.entity.status.dict_condition_afflicted["fear"] or self.entity.status.dict_condition_afflicted["blindness"]:
+        if self.entity.status.afflicted & (Condition.FEAR | Condition.BLINDNESS):
             chance_to_hit = random.randint(1, 100)
         else:
             chance_to_hit = 100
@@ -242,16 +259,16 @@ class MeleeAction(ActionWithDirection):
                 self.engine.message_log.add_message(f"{attack_desc} but does no damage.", attack_color)
                 if damage_modificator == 0:
                     self.engine.message_log.add_message(f"The {target.name} is immune.", attack_color)
-            elif self.entity.status.dict_condition_afflicted["fear"]:
+            elif self.entity.status.afflicted & Condition.FEAR:
                 self.engine.message_log.add_message(f"The {self.entity.name} missed as the fear blocked his attack.", attack_color)
-            elif self.entity.status.dict_condition_afflicted["blindness"]:
+            elif self.entity.status.afflicted & Condition.BLINDNESS:
                 self.engine.message_log.add_message(f"The {self.entity.name} missed as it's unable to see.", attack_color)
 
         
         # This checks if the player is grabbed and the enemy is dead, and then release the player from the grabbed condition
         if self.entity == self.engine.player and self.entity.status.check_grabbed_condition and (damage > 0 and damage_modificator > 0):
-            if (target.fighter.hp <= 0 or not target.is_alive) and target.status.dict_condition_attack["grab"]:
-                self.entity.status.dict_condition_afflicted["grab"] = False
+            if (target.fighter.hp <= 0 or not target.is_alive) and target.status.attack & Condition.GRAB:
+                self.entity.status.cure(Condition.GRAB)
                 self.engine.message_log.add_message(f"You are free from the grab.", attack_color)
                     
         # This checks if the player is ingested and the enemy is dead, and then release the player from the ingested condition
@@ -265,34 +282,32 @@ class MeleeAction(ActionWithDirection):
         # This checks if the entity is an enemy or the player.
         self.entity.status.affect_new_status(self, target, attack_color)
 
+        self.engine.make_noise(self.entity.x, self.entity.y)
+
 
 class ChestAction(ActionWithDirection):
     def perform(self) -> None:
+        # The chest comes from the tile index of the map, there's nothing to do if there is none.
         target = self.target_chest
-        actor_location_x = self.entity.x
-        actor_location_y = self.entity.y
+        if target is None:
+            return
         inventory = self.entity.inventory
 
-        for chest in self.engine.game_map.chests:
-            if target == chest:
-                if target.item != None:
-                    if target.locked is False:
-                        if len(inventory.items) >= inventory.capacity:
-                            raise exceptions.Impossible("Your inventory is full.")
-
-                        item = target.item
-                        item.parent = self.entity.inventory
-                        inventory.items.append(item)
-                        target.item = None
-
-                        self.engine.message_log.add_message(f"The locked chest contains {item.name}. You added it to your inventory.")
-                        return
-                    else:
-                        raise exceptions.Impossible("The chest is locked.")
-                else:
-                    raise exceptions.Impossible("The chest is empty.")
+        if target.item != None:
+            if target.locked is False:
+                if len(inventory.items) >= inventory.capacity:
+                    raise exceptions.Impossible("Your inventory is full.")
+
+                item = target.item
+                item.parent = self.entity.inventory
+                inventory.items.append(item)
+                target.item = None
+
+                self.engine.message_log.add_message(f"The locked chest contains {item.name}. You added it to your inventory.")
             else:
-                pass
+                raise exceptions.Impossible("The chest is locked.")
+        else:
+            raise exceptions.Impossible("The chest is empty.")
 
 
 class MovementAction(ActionWithDirection):
@@ -315,10 +330,10 @@ class MovementAction(ActionWithDirection):
             # The entity is grabbed and can't move.
             if self.entity is not self.engine.player:
                 if not self.entity.status.check_turns_grab:
-                    self.entity.status.dict_turns_passed["grab"] += 1
+                    self.entity.status.tick(Condition.GRAB)
                     raise exceptions.Impossible("You are grabbed, you can't move.")
                 else:
-                    self.entity.status.dict_condition_afflicted["grab"] = False
+                    self.entity.status.cure(Condition.GRAB)
                     self.engine.message_log.add_message(f"The {self.entity.name} is free from the grab!")
             else:
                 raise exceptions.Impossible("You are grabbed, you can't move.")
@@ -379,18 +394,18 @@ class BumpAction(ActionWithDirection):
         self.entity.status.status_check_in_turn(self.entity, self.engine)
 
         # Check if the player is afflicted by confusion
-        if self.entity.status.dict_condition_afflicted["confusion"]:
+        if self.entity.status.afflicted & Condition.CONFUSION:
 
             # If the number of turns is over the number of turns required for the confusion, end the confusion effect, reset the turns counter and let the player do his action
             if self.entity.status.check_turns_confusion:
-                self.entity.status.dict_condition_afflicted["confusion"] = False
+                self.entity.status.cure(Condition.CONFUSION)
                 if self.entity == self.engine.player:
                     self.engine.message_log.add_message(f"You are no longer confused!")
                 else:
                     self.engine.message_log.add_message(f"The {self.entity.name} is no longer confused.")
             # Else, it creates a random direction and return the action for the random direction
             else:
-                self.entity.status.dict_turns_passed["confusion"] += 1
+                self.entity.status.tick(Condition.CONFUSION)
                 direction_x, direction_y = random.choice(
                     [
                         (-1, -1),  # Northwest
@@ -412,17 +427,17 @@ class BumpAction(ActionWithDirection):
                     return MovementAction(self.entity, direction_x, direction_y).perform()
 
         # Check if the player is afflicted by stun
-        elif self.entity.status.dict_condition_afflicted["stun"]:
+        elif self.entity.status.afflicted & Condition.STUN:
             # If the number of turns is over the number of turns required for the stun, end the stun effect, reset the turns counter and let the player do his action
             if self.entity.status.check_turns_stun:
-                self.entity.status.dict_condition_afflicted["stun"] = False
+                self.entity.status.cure(Condition.STUN)
                 if self.entity == self.engine.player:
                     self.engine.message_log.add_message(f"You are no longer stunned!")
                 else:
                     self.engine.message_log.add_message(f"The {self.entity.name} are no longer stunned!")
             # Else, it does the wait action for a turn
             else:
-                self.entity.status.dict_turns_passed["stun"] += 1
+                self.entity.status.tick(Condition.STUN)
                 if self.entity == self.engine.player:
                     self.engine.message_log.add_message(f"You are stunned!")
                 else:
@@ -430,7 +445,7 @@ class BumpAction(ActionWithDirection):
                 return WaitAction(self.entity)
         
         # Check if the player is afflicted by blindness
-        elif self.entity.status.dict_condition_afflicted["blindness"] and self.entity is not self.engine.player:
+        elif self.entity.status.afflicted & Condition.BLINDNESS and self.entity is not self.engine.player:
             direction_x, direction_y = random.choice(
                 [
                     (-1, -1),  # Northwest
@@ -451,9 +466,9 @@ class BumpAction(ActionWithDirection):
             else:
                 return MovementAction(self.entity, direction_x, direction_y).perform()
             
-        elif self.entity.status.dict_condition_afflicted["charm"] and self.entity is self.engine.player:
+        elif self.entity.status.afflicted & Condition.CHARM and self.entity is self.engine.player:
             if not self.entity.status.check_turns_charm:
-                self.entity.status.dict_turns_passed["charm"] += 1
+                self.entity.status.tick(Condition.CHARM)
                 if self.target_actor:
                     self.engine.message_log.add_message(f"You can't attack your friend.")
                     return WaitAction(self.entity).perform()
@@ -462,7 +477,7 @@ class BumpAction(ActionWithDirection):
                 else:
                     return MovementAction(self.entity, self.dx, self.dy).perform()
             else:
-                self.entity.status.dict_condition_afflicted["charm"] = False
+                self.entity.status.cure(Condition.CHARM)
                 self.engine.message_log.add_message(f"You are no longer charmed.")
                 if self.target_actor:
                     return MeleeAction(self.entity, self.dx, self.dy).perform()
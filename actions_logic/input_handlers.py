@@ -6,12 +6,14 @@ import os
 import tcod
 import random
 from tcod import libtcodpy
-import numpy as np
 
 from actions_logic.actions import Action, BumpAction, PickupAction, WaitAction, RangedAction, MeleeAction, MovementAction
 import actions_logic.actions as actions
+from components.condition_types import Condition
 import game_map.color as color
 import utility_files.exceptions as exceptions
+import utility_files.tracing as tracing
+from utility_files.utility import DEBUG
 
 if TYPE_CHECKING:
     from game_logic.engine import Engine
@@ -76,6 +78,14 @@ MainGameEventHandler will become the active handler.
 
 
 class BaseEventHandler(tcod.event.EventDispatch[ActionOrHandler]):
+    # True when what this handler shows may have changed since it was last rendered, see main.main.
+    dirty: bool = True
+
+    def dispatch(self, event: tcod.event.Event) -> Optional[ActionOrHandler]:
+        if not isinstance(event, (tcod.event.MouseMotion, tcod.event.KeyUp)):
+            self.dirty = True  # Mouse motions mark it themselves, only when they change the tile under the mouse.
+        return super().dispatch(event)
+
     def handle_events(self, event: tcod.event.Event) -> BaseEventHandler:
         """Handle an event and return the next active event handler."""
         state = self.dispatch(event)
@@ -97,21 +107,27 @@ class PopupMessage(BaseEventHandler):
     def __init__(self, parent_handler: BaseEventHandler, text: str):
         self.parent = parent_handler
         self.text = text
+        # The popup as composed the first time, the parent can't change while it's shown.
+        self.popup_console: Optional[tcod.console.Console] = None
 
     def on_render(self, console: tcod.console.Console) -> None:
         """Render the parent and dim the result, then print the message on top."""
-        self.parent.on_render(console)
-        console.tiles_rgb["fg"] //= 8
-        console.tiles_rgb["bg"] //= 8
-
-        console.print(
-            console.width // 2,
-            console.height // 2,
-            self.text,
-            fg=color.white,
-            bg=color.black,
-            alignment=tcod.CENTER,
-        )
+        popup = self.popup_console
+        if popup is None or (popup.width, popup.height) != (console.width, console.height):
+            popup = self.popup_console = tcod.console.Console(console.width, console.height, order="F")
+            self.parent.on_render(popup)
+            popup.tiles_rgb["fg"] //= 8
+            popup.tiles_rgb["bg"] //= 8
+
+            popup.print(
+                popup.width // 2,
+                popup.height // 2,
+                self.text,
+                fg=color.white,
+                bg=color.black,
+                alignment=tcod.CENTER,
+            )
+        popup.blit(console)
 
     def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[BaseEventHandler]:
         """Any key returns to the parent handler."""
@@ -153,20 +169,34 @@ class EventHandler(BaseEventHandler):
 
         self.engine.handle_enemy_turns()
 
-        if self.engine.player.status.dict_condition_afflicted["blindness"]:
+        if self.engine.player.status.afflicted & Condition.BLINDNESS:
             self.engine.update_fov(radius=1)
         else:
             self.engine.update_fov(radius=8)
+
+        if DEBUG:
+            self.engine.game_map.check_index()
         return True
 
     def ev_mousemotion(self, event: tcod.event.MouseMotion) -> None:
         if self.engine.game_map.in_bounds(event.tile.x, event.tile.y):
-            self.engine.mouse_location = event.tile.x, event.tile.y
+            if self.engine.mouse_location != (event.tile.x, event.tile.y):
+                self.engine.mouse_location = event.tile.x, event.tile.y
+                self.dirty = True
 
     def on_render(self, console: tcod.console.Console) -> None:
         self.engine.render(console)
 
 
+# A whole player turn, the attributes are only built while tracing is on.
+tracing.instrument(
+    EventHandler,
+    "handle_action",
+    "turn",
+    lambda handler, action: {} if action is None else {"action": type(action).__name__, "actor": action.entity.name},
+)
+
+
 class AskUserEventHandler(EventHandler):
     """Handles user input for actions which require special input."""
 
@@ -211,27 +241,27 @@ class CharacterScreenEventHandler(AskUserEventHandler):
 
         y = 0
         
-        if self.engine.player.status.dict_condition_afflicted["bleed"]:
+        if self.engine.player.status.afflicted & Condition.BLEED:
             string_status = "bleeding"
-        elif self.engine.player.status.dict_condition_afflicted["poison"]:
+        elif self.engine.player.status.afflicted & Condition.POISON:
             string_status = "poisoned"
-        elif self.engine.player.status.dict_condition_afflicted["stun"]:
+        elif self.engine.player.status.afflicted & Condition.STUN:
             string_status = "stunned"
-        elif self.engine.player.status.dict_condition_afflicted["confusion"]:
+        elif self.engine.player.status.afflicted & Condition.CONFUSION:
             string_status = "confused"
-        elif self.engine.player.status.dict_condition_afflicted["grab"]:
+        elif self.engine.player.status.afflicted & Condition.GRAB:
             string_status = "grabbed"
-        elif self.engine.player.status.dict_condition_afflicted["condemnation"]:
+        elif self.engine.player.status.afflicted & Condition.CONDEMNATION:
             string_status = "condemned"
-        elif self.engine.player.status.dict_condition_afflicted["petrification"]:
+        elif self.engine.player.status.afflicted & Condition.PETRIFICATION:
             string_status = "petrifying"
-        elif self.engine.player.status.dict_condition_afflicted["fear"]:
+        elif self.engine.player.status.afflicted & Condition.FEAR:
             string_status = "afraid"
-        elif self.engine.player.status.dict_condition_afflicted["blindness"]:
+        elif self.engine.player.status.afflicted & Condition.BLINDNESS:
             string_status = "blindness"
-        elif self.engine.player.status.dict_condition_afflicted["charm"]:
+        elif self.engine.player.status.afflicted & Condition.CHARM:
             string_status = "charmed"
-        elif self.engine.player.status.dict_condition_afflicted["rage"]:
+        elif self.engine.player.status.afflicted & Condition.RAGE:
             string_status = "enraged"
         else:
             string_status = "healthy"
@@ -504,18 +534,7 @@ class NormalRangedAttackHandler(AskUserEventHandler):
         if player.equipment.ranged is not None:
             if key == tcod.event.KeySym.UP or key == tcod.event.KeySym.DOWN or key == tcod.event.KeySym.LEFT or key == tcod.event.KeySym.RIGHT:
                 dx, dy = RANGED_KEYS[key]
-                target = None
-                for actor in self.engine.game_map.actors:
-                    #Check if the distance is minor than 8 and if the actor is not the player
-                    if actor.distance(player.x, player.y) <= 8 and actor is not player:
-                        #Now check if the direction selected and the actor position is correct
-                        if (dx != 0 and actor.y == player.y) or (dy != 0 and actor.x == player.x):
-                            #If the direction is the same of the one selected, now check if the actor is the closest
-                            if (dx > 0 and (actor.x-player.x) > 0) or (dx < 0 and (actor.x-player.x) < 0) or (dy > 0 and (actor.y-player.y) > 0) or (dy < 0 and (actor.y-player.y) < 0):
-                                if target is None:
-                                    target = actor
-                                elif actor.distance(player.x, player.y) < target.distance(player.x, player.y):
-                                    target = actor
+                target = self.engine.game_map.get_nearest_actor(player.x, player.y, 8, exclude=player, direction=(dx, dy))
 
                 #If the target exist, it deals damage, otherwise it invokes the action with 0 distance
                 if not target:
@@ -586,9 +605,9 @@ class MainGameEventHandler(EventHandler):
         player = self.engine.player
         
         # If the player is enraged, it will search the closest enemy and attack him, ignoring every command
-        if player.status.dict_condition_afflicted["rage"]:
+        if player.status.afflicted & Condition.RAGE:
             if not player.status.check_turns_rage:
-                player.status.dict_turns_passed["rage"] += 1
+                player.status.tick(Condition.RAGE)
 
                 target = self.engine.game_map.get_closest_actor(player, 200, False)
                 if target:
@@ -612,7 +631,7 @@ class MainGameEventHandler(EventHandler):
 
 
             else:
-                player.status.dict_condition_afflicted["rage"] = False
+                player.status.cure(Condition.RAGE)
                 self.engine.message_log.add_message("Your mind clear itself from the fury.")
                 return MainGameEventHandler.ev_keydown(self, event)
         else:
@@ -643,6 +662,12 @@ class MainGameEventHandler(EventHandler):
                 return CharacterScreenEventHandler(self.engine)
             elif key == tcod.event.KeySym.SLASH:
                 return LookHandler(self.engine)
+            elif key == tcod.event.KeySym.F12:
+                if tracing.enabled:
+                    count = tracing.dump()
+                    self.engine.message_log.add_message(f"Saved the last {count} spans to {tracing.TRACE_FILE}.")
+                else:
+                    self.engine.message_log.add_message("Tracing is off, start the game with --trace.")
 
         # No valid key was pressed
         return action
@@ -676,28 +701,34 @@ class HistoryViewer(EventHandler):
 
     def __init__(self, engine: Engine):
         super().__init__(engine)
-        self.log_length = len(engine.message_log.messages)
+        self.log_length = len(engine.message_log)
         self.cursor = self.log_length - 1
+        # The history window as last drawn, and the (width, height, cursor) it was drawn for.
+        self.log_console: Optional[tcod.console.Console] = None
+        self.log_console_key: Optional[Tuple[int, int, int]] = None
 
     def on_render(self, console: tcod.console.Console) -> None:
         super().on_render(console)  # Draw the main state as the background.
 
-        log_console = tcod.console.Console(console.width - 6, console.height - 6)
-
-        # Draw a frame with a custom banner title.
-        log_console.draw_frame(0, 0, log_console.width, log_console.height)
-        log_console.print_box(0, 0, log_console.width, 1, "┤Message history├", alignment=libtcodpy.CENTER)
-
-        # Render the message log using the cursor parameter.
-        self.engine.message_log.render_messages(
-            log_console,
-            1,
-            1,
-            log_console.width - 2,
-            log_console.height - 2,
-            self.engine.message_log.messages[: self.cursor + 1],
-        )
-        log_console.blit(console, 3, 3)
+        key = (console.width - 6, console.height - 6, self.cursor)
+        if self.log_console_key != key:
+            log_console = self.log_console = tcod.console.Console(console.width - 6, console.height - 6)
+            self.log_console_key = key
+
+            # Draw a frame with a custom banner title.
+            log_console.draw_frame(0, 0, log_console.width, log_console.height)
+            log_console.print_box(0, 0, log_console.width, 1, "┤Message history├", alignment=libtcodpy.CENTER)
+
+            # Render the message log using the cursor parameter.
+            self.engine.message_log.render_messages(
+                log_console,
+                1,
+                1,
+                log_console.width - 2,
+                log_console.height - 2,
+                self.engine.message_log.history(self.cursor + 1),
+            )
+        self.log_console.blit(console, 3, 3)
 
     def ev_keydown(self, event: tcod.event.KeyDown) -> Optional[MainGameEventHandler]:
         # Fancy conditional movement to make it feel right.
@@ -726,17 +757,7 @@ def get_path_to_for_player(self, engine: Engine, dest_x: int, dest_y: int):
 
     If there is no valid path then returns an empty list.
         """
-    # Copy the walkable array.
-    cost = np.array(engine.game_map.tiles["walkable"], dtype=np.int8)
-
-    for entity in engine.game_map.entities:
-        # Check that an enitiy blocks movement and the cost isn't zero (blocking.)
-        if entity.blocks_movement and cost[entity.x, entity.y]:
-            # Add to the cost of a blocked position.
-            # A lower number means more enemies will crowd behind each other in
-            # hallways.  A higher number means enemies will take longer paths in
-            # order to surround the player.
-            cost[entity.x, entity.y] += 10
+    cost = engine.game_map.path_cost()
 
     # Create a graph from the cost array and pass that graph to a new pathfinder.
     graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
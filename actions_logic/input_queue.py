@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Deque, Iterable, Iterator, Optional
+import time
+
+import tcod
+
+
+class InputQueue:
+    """Filters each batch of events before the handlers see them, so a held key can't queue up turns.
+
+    A batch only holds many key repeats when turns take longer than the OS repeat rate, the repeats beyond
+    `max_repeats` are dropped instead of moving the player long after the key was released. After interrupt,
+    repeats are ignored until a key is pressed again. Consecutive mouse motions are merged into the last one.
+    """
+
+    def __init__(self, max_repeats: int = 1):
+        self.max_repeats = max_repeats
+        self.repeats_blocked = False
+        self.dropped_repeats = 0
+        # Seconds between a batch of events arriving and the frame showing its result being presented.
+        self.latencies: Deque[float] = deque(maxlen=256)
+        self._batch_time: Optional[float] = None
+
+    def interrupt(self) -> None:
+        """Stop the key being held from repeating, until it's pressed again."""
+        self.repeats_blocked = True
+
+    def filter(self, events: Iterable[tcod.event.Event]) -> Iterator[tcod.event.Event]:
+        """Yield the events of a batch worth handling, lazily so an interrupt applies to the rest of the batch."""
+        self._batch_time = time.perf_counter()
+        repeats = 0
+        motion = None
+        for event in events:
+            if isinstance(event, tcod.event.MouseMotion):
+                motion = event
+                continue
+            if motion is not None:
+                yield motion
+                motion = None
+            if isinstance(event, tcod.event.KeyDown):
+                if not event.repeat:
+                    self.repeats_blocked = False
+                else:
+                    repeats += 1
+                    if self.repeats_blocked or repeats > self.max_repeats:
+                        self.dropped_repeats += 1
+                        continue
+            yield event
+        if motion is not None:
+            yield motion
+
+    def presented(self) -> None:
+        """Record the latency of the last batch, its result was just presented."""
+        if self._batch_time is not None:
+            self.latencies.append(time.perf_counter() - self._batch_time)
+            self._batch_time = None
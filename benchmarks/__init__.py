@@ -0,0 +1 @@
+"""Benchmarks of the game hot paths, run them from the repository root with `python -m benchmarks.<name>`."""
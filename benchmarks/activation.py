@@ -0,0 +1,77 @@
+"""Measure the cost of an enemy turn on a large floor crowded with monsters.
+
+Compares the actor activation tiers against running the full AI of every actor:
+
+    python -m benchmarks.activation --monsters 1000 --turns 50
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from actions_logic.actions import WaitAction
+from entity.entity_factories import entities
+from game_logic.activation import ActivationTier, ActorActivation
+from game_logic.engine import Engine
+from game_map.game_map import GameMap
+import game_map.tile_types as tile_types
+
+
+def crowded_engine(monsters: int, width: int, height: int, seed: int) -> Engine:
+    """Return an engine on an open floor with the player in the middle, surrounded by monsters."""
+    random.seed(seed)
+    player = entities.player.clone()
+    player.fighter.max_hp = player.fighter.hp = 10**9  # The benchmark must not end early.
+
+    engine = Engine(player=player)
+    engine.game_map = GameMap(engine, width, height)
+    engine.game_map.set_tiles(np.s_[1:-1, 1:-1], tile_types.floor)
+    player.place(width // 2, height // 2, engine.game_map)
+
+    spawned = 0
+    while spawned < monsters:
+        x, y = random.randrange(1, width - 1), random.randrange(1, height - 1)
+        if not engine.game_map.get_blocking_entity_at_location(x, y):
+            random.choice([entities.meelee_orc, entities.ranged_orc, entities.troll]).spawn(engine.game_map, x, y)
+            spawned += 1
+
+    engine.update_fov(radius=8)
+    return engine
+
+
+def run(engine: Engine, turns: int) -> float:
+    """Return the average time, in milliseconds, of a player turn."""
+    start = time.perf_counter()
+    for _ in range(turns):
+        WaitAction(engine.player).perform()
+        engine.handle_enemy_turns()
+        engine.update_fov(radius=8)
+    return (time.perf_counter() - start) / turns * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--monsters", type=int, default=1000)
+    parser.add_argument("--turns", type=int, default=50)
+    parser.add_argument("--width", type=int, default=200)
+    parser.add_argument("--height", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    for label, activation in (
+        ("full AI for every actor", ActorActivation(wake_radius=10**6, drift_radius=10**6)),
+        ("activation tiers", ActorActivation()),
+    ):
+        engine = crowded_engine(args.monsters, args.width, args.height, args.seed)
+        engine.activation = activation
+        run(engine, 2)  # Warm up, the first turns put the far away actors to sleep.
+        elapsed = run(engine, args.turns)
+        counters = ", ".join(f"{tier.name.lower()}={count}" for tier, count in activation.counters.items())
+        print(f"{label}: {elapsed:.2f} ms per turn ({counters})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measure how long generating floors takes, building the entities with Entity.clone and with copy.deepcopy:
+
+    python -m benchmarks.floors --floors 1000
+"""
+from __future__ import annotations
+
+import argparse
+import copy
+import random
+import time
+from unittest import mock
+
+from entity import prototypes
+from entity.entity import Actor, Chest, Entity, Item
+from entity.entity_factories import entities  # noqa: F401, registers the prototypes.
+from game_logic.engine import Engine
+from game_map.game_map import GameWorld
+
+
+def generate_floors(floors: int, seed: int) -> float:
+    """Return the time, in seconds, taken to generate `floors` floors, going down to floor 10 and back up."""
+    random.seed(seed)
+    engine = Engine(player=prototypes.build("player"))
+    engine.game_world = GameWorld(
+        engine=engine, max_rooms=30, room_min_size=6, room_max_size=10, map_width=80, map_height=43
+    )
+
+    start = time.perf_counter()
+    for floor in range(floors):
+        engine.game_world.current_floor = floor % 10
+        engine.game_world.generate_floor()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--floors", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    cloned = generate_floors(args.floors, args.seed)
+    print(f"Entity.clone: {cloned:.2f} s")
+
+    deepcopy = lambda self: copy.deepcopy(self)
+    with mock.patch.object(Entity, "clone", deepcopy), mock.patch.object(Actor, "clone", deepcopy), \
+            mock.patch.object(Item, "clone", deepcopy), mock.patch.object(Chest, "clone", deepcopy):
+        deepcopied = generate_floors(args.floors, args.seed)
+    print(f"copy.deepcopy: {deepcopied:.2f} s ({deepcopied / cloned:.1f}x slower)")
+
+
+if __name__ == "__main__":
+    main()
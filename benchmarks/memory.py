@@ -0,0 +1,105 @@
+"""Measure how much memory, and how many pickled bytes, each actor prototype costs once spawned:
+
+    python -m benchmarks.memory --copies 1000
+
+The baseline is the same actor without __slots__: every slotted object of a copy is mirrored by an instance of a
+plain class holding the same attributes in its __dict__, like the entities and components were laid out before.
+"""
+from __future__ import annotations
+
+from enum import Enum
+from typing import Any, Callable, Dict, List, Tuple
+import argparse
+import pickle
+import tracemalloc
+
+from entity.entity import Actor
+from entity.entity_factories import entities
+from utility_files.utility import slot_names
+
+# Plain classes standing in for the slotted ones, registered in this module so their instances can be pickled.
+_dict_classes: Dict[type, type] = {}
+
+
+def dict_class(cls: type) -> type:
+    if cls not in _dict_classes:
+        name = f"{cls.__name__}WithDict"
+        _dict_classes[cls] = globals()[name] = type(name, (), {"__module__": __name__})
+    return _dict_classes[cls]
+
+
+def without_slots(value: Any, memo: Dict[int, Any]) -> Any:
+    """Return a copy of `value` with every slotted object replaced by an equivalent object with a __dict__.
+
+    Objects already in `memo`, by id, are reused, which keeps what copies share with their prototype shared.
+    Immutable values and objects pickled by reference, like species, are kept as they are.
+    """
+    if id(value) in memo:
+        return memo[id(value)]
+    cls = type(value)
+    copy: Any
+    if isinstance(value, list):
+        copy = memo[id(value)] = []
+        copy.extend(without_slots(item, memo) for item in value)
+    elif isinstance(value, dict):
+        copy = memo[id(value)] = {}
+        copy.update((key, without_slots(item, memo)) for key, item in value.items())
+    elif slot_names(cls) and not isinstance(value, Enum) and "__reduce__" not in cls.__dict__:
+        copy = memo[id(value)] = object.__new__(dict_class(cls))
+        for name in slot_names(cls):
+            if hasattr(value, name):
+                setattr(copy, name, without_slots(getattr(value, name), memo))
+    else:
+        copy = value
+    return copy
+
+
+def copies_with_and_without_slots(prototype: Actor, copies: int) -> Tuple[List[Actor], Callable[[], List[Any]]]:
+    """Return copies of a prototype, and a function building their slot-less mirrors."""
+    shared: Dict[int, Any] = {}
+    without_slots(prototype, shared)
+    clones = [prototype.clone() for _ in range(copies)]
+    return clones, lambda: [without_slots(clone, dict(shared)) for clone in clones]
+
+
+def allocated(build: Callable[[], List[Any]]) -> int:
+    """Return the memory still allocated by the objects `build` returns."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def bytes_per_copy(prototype: Actor, copies: int) -> Tuple[float, float]:
+    """Return the memory allocated per copy of a prototype, including all its components, with and without slots."""
+    with_slots = allocated(lambda: [prototype.clone() for _ in range(copies)])
+    _, build_mirrors = copies_with_and_without_slots(prototype, copies)
+    return with_slots / copies, allocated(build_mirrors) / copies
+
+
+def pickled_bytes_per_copy(prototype: Actor, copies: int) -> Tuple[float, float]:
+    clones, build_mirrors = copies_with_and_without_slots(prototype, copies)
+    with_slots = len(pickle.dumps(clones, pickle.HIGHEST_PROTOCOL))
+    return with_slots / copies, len(pickle.dumps(build_mirrors(), pickle.HIGHEST_PROTOCOL)) / copies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--copies", type=int, default=1000)
+    args = parser.parse_args()
+
+    prototypes = {name: value for name, value in vars(entities).items() if isinstance(value, Actor)}
+    for name, prototype in prototypes.items():
+        memory, memory_baseline = bytes_per_copy(prototype, args.copies)
+        pickled, pickled_baseline = pickled_bytes_per_copy(prototype, args.copies)
+        print(
+            f"{name}: {memory:.0f} bytes in memory ({memory_baseline:.0f} without slots), "
+            f"{pickled:.0f} bytes pickled ({pickled_baseline:.0f} without slots)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""Time the hot paths of the game, and compare the results against a baseline:
+
+    python -m benchmarks.suite run --output results.json
+    python -m benchmarks.suite compare baseline.json results.json --threshold 0.1
+
+Every benchmark builds its state before being timed, then runs a few warm-up calls. The random generator is
+seeded again before each call, and benchmarks changing their state build it again, so every call does the same
+work. compare exits with status 1 if a benchmark got slower than the baseline by more than the threshold.
+"""
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Set
+import argparse
+import atexit
+import fnmatch
+import functools
+import gc
+import itertools
+import json
+import os
+import pickle
+import platform
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+import tcod
+
+from actions_logic.actions import WaitAction
+from benchmarks.activation import crowded_engine
+from entity.entity_factories import entities
+from game_logic.activation import ActorActivation
+from game_logic.engine import Engine
+from game_map.game_map import GameMap
+from render_logic.message_log import MessageLog
+import game_map.tile_types as tile_types
+
+SEED = 42
+
+# Each benchmark builds its state and returns the function to time.
+BENCHMARKS: Dict[str, Callable[[], Callable[[], object]]] = {}
+# Benchmarks whose state is built again before each call, because the timed function changes it.
+STATEFUL: Set[str] = set()
+
+
+def benchmark(name: str, stateful: bool = False, **kwargs: object) -> Callable:
+    def register(setup: Callable[..., Callable[[], object]]) -> Callable[..., Callable[[], object]]:
+        BENCHMARKS[name] = functools.partial(setup, **kwargs)
+        if stateful:
+            STATEFUL.add(name)
+        return setup
+
+    return register
+
+
+def new_engine() -> Engine:
+    from game_logic.setup_game import new_game
+
+    engine = new_game()
+    engine.player.fighter.max_hp = engine.player.fighter.hp = 10**9  # The benchmarks must not end early.
+    return engine
+
+
+@benchmark("generate_dungeon_320x172", width=320, height=172)
+@benchmark("generate_dungeon_160x86", width=160, height=86)
+@benchmark("generate_dungeon_80x43", width=80, height=43)
+def generate_dungeon(width: int, height: int) -> Callable[[], object]:
+    from game_map.procgen import generate_dungeon
+
+    engine = new_engine()
+    rooms = 30 * (width * height) // (80 * 43)
+    return lambda: generate_dungeon(rooms, 6, 10, width, height, engine)
+
+
+@benchmark("get_path_to_repaired", mode="repaired")
+@benchmark("get_path_to_cached", mode="cached")
+@benchmark("get_path_to", mode="search")
+def get_path_to(mode: str) -> Callable[[], object]:
+    """Time a path request across the map: a new search, a cache hit, or a repair after the target moved."""
+    engine = crowded_engine(1, 80, 43, SEED)
+    actor = next(actor for actor in engine.game_map.actors if actor is not engine.player)
+    actor.place(1, 1, engine.game_map)
+    actor.ai.get_path_to(78, 41)
+    # The repaired target steps back and forth between two tiles, each call extends or cuts the path by one.
+    targets = itertools.cycle([(77, 41), (78, 41)])
+
+    def run() -> object:
+        if mode == "search":
+            actor.ai.path_target = None  # Don't reuse the path of the previous call.
+            return actor.ai.get_path_to(78, 41)
+        if mode == "cached":
+            return actor.ai.get_path_to(78, 41)
+        return actor.ai.get_path_to(*next(targets))
+
+    return run
+
+
+@benchmark("update_fov")
+def update_fov() -> Callable[[], object]:
+    engine = new_engine()
+    game_map = engine.game_map
+    # More locations than the FOV memo holds, every call computes the field of view.
+    locations = list(zip(*np.nonzero(game_map.tiles["walkable"])))[:64]
+
+    def run() -> None:
+        for x, y in locations:
+            engine.player.x, engine.player.y = int(x), int(y)
+            engine.update_fov(radius=8)
+
+    return run
+
+
+@benchmark("render_map")
+def render_map() -> Callable[[], object]:
+    engine = new_engine()
+    console = tcod.console.Console(80, 50, order="F")
+    return lambda: engine.game_map.render(console)
+
+
+@benchmark("render_messages")
+def render_messages() -> Callable[[], object]:
+    log = MessageLog()
+    for i in range(2000):
+        log.add_message(f"The orc {i} hits you for {i % 7} hit points, you feel weaker.", stack=False)
+    console = tcod.console.Console(80, 50, order="F")
+    return lambda: log.render_messages(console, 1, 1, 74, 42, log.history(len(log)))
+
+
+@benchmark("save_and_load")
+def save_and_load() -> Callable[[], object]:
+    from game_logic.setup_game import load_game
+
+    engine = new_engine()
+    handle, filename = tempfile.mkstemp(suffix=".sav")
+    os.close(handle)
+    atexit.register(os.remove, filename)
+
+    def run() -> Engine:
+        engine.save_as(filename)
+        return load_game(filename)
+
+    return run
+
+
+@benchmark("spawn_100")
+def spawn() -> Callable[[], object]:
+    engine = new_engine()
+
+    def run() -> None:
+        game_map = GameMap(engine, 80, 43)
+        game_map.set_tiles(np.s_[1:-1, 1:-1], tile_types.floor)
+        for i in range(100):
+            entities.meelee_orc.spawn(game_map, 1 + i % 78, 1 + i // 78)
+
+    return run
+
+
+@functools.lru_cache(maxsize=None)
+def tiered_snapshot(monsters: int) -> bytes:
+    """Return a pickled engine with the monsters spread evenly between the activation tiers around the player."""
+    random.seed(SEED)
+    engine = crowded_engine(0, 100, 80, SEED)
+    game_map, player = engine.game_map, engine.player
+    activation = ActorActivation()
+    # Distance bands of the AWAKE, DRIFTING and DORMANT tiers.
+    bands = [
+        (0, activation.wake_radius),
+        (activation.wake_radius, activation.drift_radius),
+        (activation.drift_radius, max(game_map.width, game_map.height)),
+    ]
+    for i in range(monsters):
+        low, high = bands[i % len(bands)]
+        while True:
+            x, y = random.randrange(1, game_map.width - 1), random.randrange(1, game_map.height - 1)
+            if low**2 < (x - player.x) ** 2 + (y - player.y) ** 2 <= high**2:
+                if not game_map.get_blocking_entity_at_location(x, y):
+                    break
+        random.choice([entities.meelee_orc, entities.ranged_orc, entities.troll]).spawn(game_map, x, y)
+    engine.update_fov(radius=8)
+    return pickle.dumps(engine)
+
+
+@benchmark("enemy_turns_1000", stateful=True, monsters=1000)
+@benchmark("enemy_turns_100", stateful=True, monsters=100)
+@benchmark("enemy_turns_10", stateful=True, monsters=10)
+def enemy_turns(monsters: int) -> Callable[[], object]:
+    engine = pickle.loads(tiered_snapshot(monsters))
+
+    def run() -> None:
+        WaitAction(engine.player).perform()
+        engine.handle_enemy_turns()
+
+    return run
+
+
+def run_benchmark(name: str, repeats: int, warmup: int) -> Dict[str, float]:
+    """Return the median and minimum time of a call of a benchmark, in milliseconds."""
+    random.seed(SEED)
+    function = BENCHMARKS[name]()
+    times = []
+    for call in range(warmup + repeats):
+        if call and name in STATEFUL:
+            function = BENCHMARKS[name]()
+        random.seed(SEED)
+        gc.collect()
+        gc.disable()  # Like timeit, a collection triggered by earlier garbage shouldn't land in the timing.
+        try:
+            start = time.perf_counter()
+            function()
+            elapsed = time.perf_counter() - start
+        finally:
+            gc.enable()
+        if call >= warmup:
+            times.append(elapsed * 1000)
+    return {"median_ms": float(np.median(times)), "min_ms": min(times), "repeats": repeats}
+
+
+def run(args: argparse.Namespace) -> int:
+    names = [name for name in BENCHMARKS if not args.filter or any(fnmatch.fnmatchcase(name, f) for f in args.filter)]
+    results = {}
+    for name in names:
+        results[name] = run_benchmark(name, args.repeats, args.warmup)
+        print(f"{name}: {results[name]['median_ms']:.3f} ms (min {results[name]['min_ms']:.3f} ms)")
+
+    if args.output:
+        data = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": SEED,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(data, f, indent=2)
+    return 0
+
+
+def compare(args: argparse.Namespace) -> int:
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    with open(args.results) as f:
+        results = json.load(f)["results"]
+
+    regressions = 0
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name}: no baseline")
+            continue
+        ratio = result["median_ms"] / baseline[name]["median_ms"]
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  REGRESSION"
+            regressions += 1
+        print(f"{name}: {baseline[name]['median_ms']:.3f} -> {result['median_ms']:.3f} ms ({ratio:.2f}x){flag}")
+    return 1 if regressions else 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Run the benchmarks.")
+    run_parser.add_argument("--output", help="JSON file to write the results to.")
+    run_parser.add_argument("--repeats", type=int, default=20)
+    run_parser.add_argument("--warmup", type=int, default=3)
+    run_parser.add_argument(
+        "--filter", nargs="*", help="Only run the benchmarks matching one of these names or patterns, like enemy_turns_*."
+    )
+    run_parser.set_defaults(handler=run)
+
+    compare_parser = commands.add_parser("compare", help="Flag the regressions of results against a baseline.")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("results")
+    compare_parser.add_argument("--threshold", type=float, default=0.1, help="Allowed slowdown, 0.1 is 10%%.")
+    compare_parser.set_defaults(handler=compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
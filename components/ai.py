@@ -3,10 +3,10 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, List, Optional, Tuple
 import random
 
-import numpy as np
 import tcod
 
 from actions_logic.actions import Action, BumpAction, MeleeAction, MovementAction, WaitAction, RangedAction, SpecialAttackAction
+from components.condition_types import Condition
 from entity.entity import Actor
 
 if TYPE_CHECKING:
@@ -14,26 +14,115 @@ if TYPE_CHECKING:
     from components.status import confusion_direction
 
 
+# The eight directions an actor can step to.
+DIRECTIONS = [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+
 class BaseAI(Action):
+    __slots__ = ("path", "path_target", "path_tiles_version", "last_known_position", "turns_since_drift")
+
+    # Pathfinding statistics of every AI, to measure how often a path is answered without a search.
+    # Requests include the steps down the distance map shared by the actors chasing the player, building that
+    # map counts as one search. The repairs only happen on the cached paths to other targets.
+    path_requests: int = 0
+    path_searches: int = 0
+    path_repairs: int = 0
+    distance_map_steps: int = 0
+
+    def __init__(self, entity: Actor):
+        super().__init__(entity)
+        # The path is consumed one step per turn, and reused as long as it still leads to the target.
+        self.path: List[Tuple[int, int]] = []
+        self.path_target: Optional[Tuple[int, int]] = None
+        self.path_tiles_version = -1
+        # Used by ActorActivation while the actor is too far away to run its full AI.
+        self.last_known_position: Optional[Tuple[int, int]] = None
+        self.turns_since_drift = 0
+
+    @classmethod
+    def path_cache_hit_ratio(cls) -> float:
+        """Return the fraction of path requests answered without a new search."""
+        if cls.path_requests == 0:
+            return 0.0
+        return 1 - cls.path_searches / cls.path_requests
+
     def perform(self) -> None:
         raise NotImplementedError()
 
+    def get_path_towards(self, target: Actor) -> List[Tuple[int, int]]:
+        """Return the path to follow this turn to reach the target.
+
+        Actors chasing the player step downhill on the distance map shared by the whole enemy turn, so the
+        path only holds the next step. Other targets fall back to a search of their own.
+        """
+        if target is not self.engine.player:
+            return self.get_path_to(target.x, target.y)
+
+        self.path_target = None  # The step below is not a cached path.
+        BaseAI.path_requests += 1
+        BaseAI.distance_map_steps += 1
+        if (target.x, target.y) not in self.engine.distance_maps:
+            BaseAI.path_searches += 1  # This actor is the first one to chase the player this turn.
+        distance = self.engine.get_distance_map(target.x, target.y)
+        x, y = self.entity.x, self.entity.y
+        step = None
+        step_distance = distance[x, y]
+        for dx, dy in DIRECTIONS:
+            if self.engine.game_map.in_bounds(x + dx, y + dy) and distance[x + dx, y + dy] < step_distance:
+                step = (x + dx, y + dy)
+                step_distance = distance[step]
+
+        return [step] if step else []
+
     def get_path_to(self, dest_x: int, dest_y: int) -> List[Tuple[int, int]]:
+        """Return a path to the target position, reusing the previous one when possible.
+
+        The previous path is kept if the map tiles didn't change, its next step is still free and the target
+        moved by at most one tile, in which case the path is extended or cut to the new position.
+        If there is no valid path then returns an empty list.
+        """
+        BaseAI.path_requests += 1
+
+        if self.cached_path_is_valid():
+            target_x, target_y = self.path_target
+            if (dest_x, dest_y) == self.path_target:
+                return self.path
+            if max(abs(dest_x - target_x), abs(dest_y - target_y)) <= 1:
+                BaseAI.path_repairs += 1
+                if (dest_x, dest_y) in self.path:
+                    # The target stepped back along the path.
+                    del self.path[self.path.index((dest_x, dest_y)) + 1 :]
+                else:
+                    self.path.append((dest_x, dest_y))
+                self.path_target = (dest_x, dest_y)
+                return self.path
+
+        BaseAI.path_searches += 1
+        self.path = self.search_path_to(dest_x, dest_y)
+        self.path_target = (dest_x, dest_y)
+        self.path_tiles_version = self.entity.gamemap.tiles_version
+        return self.path
+
+    def cached_path_is_valid(self) -> bool:
+        """Return True if the cached path can still be followed from the current position."""
+        if not self.path or self.path_target is None:
+            return False
+        if self.path_tiles_version != self.entity.gamemap.tiles_version:
+            return False
+
+        next_x, next_y = self.path[0]
+        if max(abs(next_x - self.entity.x), abs(next_y - self.entity.y)) != 1:
+            return False  # The last step wasn't taken.
+        if (next_x, next_y) != self.path_target and self.entity.gamemap.get_blocking_entity_at_location(next_x, next_y):
+            return False
+        return True
+
+    def search_path_to(self, dest_x: int, dest_y: int) -> List[Tuple[int, int]]:
         """Compute and return a path to the target position.
 
         If there is no valid path then returns an empty list.
         """
-        # Copy the walkable array.
-        cost = np.array(self.entity.gamemap.tiles["walkable"], dtype=np.int8)
-
-        for entity in self.entity.gamemap.entities:
-            # Check that an enitiy blocks movement and the cost isn't zero (blocking.)
-            if entity.blocks_movement and cost[entity.x, entity.y]:
-                # Add to the cost of a blocked position.
-                # A lower number means more enemies will crowd behind each other in
-                # hallways.  A higher number means enemies will take longer paths in
-                # order to surround the player.
-                cost[entity.x, entity.y] += 10
+        cost = self.entity.gamemap.path_cost()
 
         # Create a graph from the cost array and pass that graph to a new pathfinder.
         graph = tcod.path.SimpleGraph(cost=cost, cardinal=2, diagonal=3)
@@ -50,26 +139,24 @@ class BaseAI(Action):
 
 #This AI is for normal enemy that attack meelee
 class HostileMeeleeEnemy(BaseAI):
-    def __init__(self, entity: Actor):
-        super().__init__(entity)
-        self.path: List[Tuple[int, int]] = []
+    __slots__ = ()
 
     def perform(self) -> None:        
         # If the entity is confused, it does a BumpAction with a random direction
-        if self.entity.status.dict_condition_afflicted["confusion"]:
+        if self.entity.status.afflicted & Condition.CONFUSION:
             return BumpAction(self.entity, 1, 1).perform()
         # If the entity is charmed, it attacks the closest actor (not the player) or it moves close to it, otherwise it waits
         # If the entity is enraged, it attacks the closest actor or it moves close to it, otherwise it waits 
         # If it's not both, it attacks the player or it moves close to it, otherwise it waits
         else:
-            if not ((self.entity.status.check_turns_charm and self.entity.status.dict_condition_afflicted["charm"]) or (self.entity.status.check_turns_rage and self.entity.status.dict_condition_afflicted["rage"])) or (not self.entity.status.dict_condition_afflicted["charm"] and self.entity.status.dict_condition_afflicted["rage"]):
+            if not ((self.entity.status.check_turns_charm and self.entity.status.afflicted & Condition.CHARM) or (self.entity.status.check_turns_rage and self.entity.status.afflicted & Condition.RAGE)) or (not self.entity.status.afflicted & Condition.CHARM and self.entity.status.afflicted & Condition.RAGE):
                 
                 #The target is chosen depending on the status
-                if self.entity.status.dict_condition_afflicted["charm"]:
-                    self.entity.status.dict_turns_passed["charm"] += 1
+                if self.entity.status.afflicted & Condition.CHARM:
+                    self.entity.status.tick(Condition.CHARM)
                     target = self.engine.game_map.get_closest_actor(self.entity, 15, False)
-                elif self.entity.status.dict_condition_afflicted["rage"]:
-                    self.entity.status.dict_turns_passed["rage"] += 1
+                elif self.entity.status.afflicted & Condition.RAGE:
+                    self.entity.status.tick(Condition.RAGE)
                     target = self.engine.game_map.get_closest_actor(self.entity, 15, True)
                 else:
                     target = self.engine.player
@@ -82,12 +169,12 @@ class HostileMeeleeEnemy(BaseAI):
                         if distance <= 1:
                             return MeleeAction(self.entity, dx, dy).perform()
                         
-                        self.path = self.get_path_to(target.x, target.y)
+                        self.path = self.get_path_towards(target)
 
                          # If the entity is not afraid, it moves in the direction of the player
-                        if not self.entity.status.dict_condition_afflicted["fear"]:
+                        if not self.entity.status.afflicted & Condition.FEAR:
                             # If the entity is not blind, it moves in the direction of the player
-                            if not self.entity.status.dict_condition_afflicted["blindness"]:
+                            if not self.entity.status.afflicted & Condition.BLINDNESS:
                                 if self.path:
                                     dest_x, dest_y = self.path.pop(0)
                                     return MovementAction(
@@ -109,39 +196,35 @@ class HostileMeeleeEnemy(BaseAI):
                                     -(dest_y - self.entity.y),
                                 ).perform()
             else:
-                if self.entity.status.dict_condition_afflicted["charm"]:
+                if self.entity.status.afflicted & Condition.CHARM:
                     self.engine.message_log.add_message(f"The {self.entity.name} is no longer charmed.")
-                    self.entity.status.dict_turns_passed["charm"] = 0
-                    self.entity.status.dict_condition_afflicted["charm"] = False
-                elif self.entity.status.dict_condition_afflicted["rage"]:
+                    self.entity.status.cure(Condition.CHARM)
+                elif self.entity.status.afflicted & Condition.RAGE:
                     self.engine.message_log.add_message(f"The {self.entity.name} is no longer enraged.")
-                    self.entity.status.dict_turns_passed["rage"] = 0
-                    self.entity.status.dict_condition_afflicted["rage"] = False
+                    self.entity.status.cure(Condition.RAGE)
         return WaitAction(self.entity).perform()
 
 
 # This AI is for enemy that attacks with a basic ranged attack
 class HostileRangedEnemy(BaseAI):
-    def __init__(self, entity: Actor):
-        super().__init__(entity)
-        self.path: List[Tuple[int, int]] = []
+    __slots__ = ()
 
     def perform(self) -> None:        
         # If the entity is confused, it does a BumpAction with a random direction
-        if self.entity.status.dict_condition_afflicted["confusion"]:
+        if self.entity.status.afflicted & Condition.CONFUSION:
             return BumpAction(self.entity, 1, 1).perform()
         # If the entity is charmed, it attacks the closest actor (not the player) or it moves close to it, otherwise it waits
         # If the entity is enraged, it attacks the closest actor or it moves close to it, otherwise it waits 
         # If it's not both, it attacks the player or it moves close to it, otherwise it waits
         else:
-            if not ((self.entity.status.check_turns_charm and self.entity.status.dict_condition_afflicted["charm"]) or (self.entity.status.check_turns_rage and self.entity.status.dict_condition_afflicted["rage"])) or (not self.entity.status.dict_condition_afflicted["charm"] and self.entity.status.dict_condition_afflicted["rage"]):
+            if not ((self.entity.status.check_turns_charm and self.entity.status.afflicted & Condition.CHARM) or (self.entity.status.check_turns_rage and self.entity.status.afflicted & Condition.RAGE)) or (not self.entity.status.afflicted & Condition.CHARM and self.entity.status.afflicted & Condition.RAGE):
                 
                 #The target is chosen depending on the status
-                if self.entity.status.dict_condition_afflicted["charm"]:
-                    self.entity.status.dict_turns_passed["charm"] += 1
+                if self.entity.status.afflicted & Condition.CHARM:
+                    self.entity.status.tick(Condition.CHARM)
                     target = self.engine.game_map.get_closest_actor(self.entity, 15, False)
-                elif self.entity.status.dict_condition_afflicted["rage"]:
-                    self.entity.status.dict_turns_passed["rage"] += 1
+                elif self.entity.status.afflicted & Condition.RAGE:
+                    self.entity.status.tick(Condition.RAGE)
                     target = self.engine.game_map.get_closest_actor(self.entity, 15, True)
                 else:
                     target = self.engine.player
@@ -154,12 +237,12 @@ class HostileRangedEnemy(BaseAI):
                         if distance <= 3 and ((dx != 0 and self.entity.y == target.y) or (dy != 0 and self.entity.x == target.x)):
                             return RangedAction(self.entity, dx, dy).perform()
                         
-                        self.path = self.get_path_to(target.x, target.y)
+                        self.path = self.get_path_towards(target)
 
                          # If the entity is not afraid, it moves in the direction of the player
-                        if not self.entity.status.dict_condition_afflicted["fear"]:
+                        if not self.entity.status.afflicted & Condition.FEAR:
                             # If the entity is not blind, it moves in the direction of the player
-                            if not self.entity.status.dict_condition_afflicted["blindness"]:
+                            if not self.entity.status.afflicted & Condition.BLINDNESS:
                                 if self.path:
                                     dest_x, dest_y = self.path.pop(0)
                                     return MovementAction(
@@ -181,22 +264,18 @@ class HostileRangedEnemy(BaseAI):
                                     -(dest_y - self.entity.y),
                                 ).perform()
             else:
-                if self.entity.status.dict_condition_afflicted["charm"]:
+                if self.entity.status.afflicted & Condition.CHARM:
                     self.engine.message_log.add_message(f"The {self.entity.name} is no longer charmed.")
-                    self.entity.status.dict_turns_passed["charm"] = 0
-                    self.entity.status.dict_condition_afflicted["charm"] = False
-                elif self.entity.status.dict_condition_afflicted["rage"]:
+                    self.entity.status.cure(Condition.CHARM)
+                elif self.entity.status.afflicted & Condition.RAGE:
                     self.engine.message_log.add_message(f"The {self.entity.name} is no longer enraged.")
-                    self.entity.status.dict_turns_passed["rage"] = 0
-                    self.entity.status.dict_condition_afflicted["rage"] = False
+                    self.entity.status.cure(Condition.RAGE)
         return WaitAction(self.entity).perform()
 
 
 # This AI is for enemy that uses special attacks
 class SpecialEnemy(BaseAI):
-    def __init__(self, entity: Actor):
-        super().__init__(entity)
-        self.path: List[Tuple[int, int]] = []
+    __slots__ = ()
 
     def perform(self) -> None:
         target = self.engine.player
@@ -240,7 +319,7 @@ class SpecialEnemy(BaseAI):
                     return MeleeAction(self.entity, dx, dy).perform()
                 
 
-            self.path = self.get_path_to(target.x, target.y)
+            self.path = self.get_path_towards(target)
             
             if self.path:
                 dest_x, dest_y = self.path.pop(0)
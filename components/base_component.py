@@ -1,14 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, TypeVar
+
+from utility_files.utility import shallow_clone
 
 if TYPE_CHECKING:
     from game_logic.engine import Engine
     from entity.entity import Entity
     from game_map.game_map import GameMap
 
+T = TypeVar("T", bound="BaseComponent")
+
 
 class BaseComponent:
+    __slots__ = ("parent",)
+
     parent: Entity  # Owning entity instance.
 
     @property
@@ -18,3 +24,12 @@ class BaseComponent:
     @property
     def engine(self) -> Engine:
         return self.gamemap.engine
+
+    def clone(self: T, parent: Entity) -> T:
+        """Return a copy of this component for another entity.
+
+        Attributes are shared with the original, components holding mutable containers override this to copy them.
+        """
+        clone = shallow_clone(self)
+        clone.parent = parent
+        return clone
@@ -0,0 +1,21 @@
+from enum import IntEnum
+
+class Condition(IntEnum):
+    """Conditions an actor can suffer, as bit flags that can be combined into a mask with |.
+
+    Not an IntFlag, the operators of IntEnum are the ones of int, so mask tests stay cheap.
+    """
+    BLEED = 1 << 0
+    POISON = 1 << 1
+    STUN = 1 << 2
+    CONFUSION = 1 << 3
+    GRAB = 1 << 4
+    CONDEMNATION = 1 << 5
+    PETRIFICATION = 1 << 6
+    FEAR = 1 << 7
+    BLINDNESS = 1 << 8
+    CHARM = 1 << 9
+    RAGE = 1 << 10
+
+# Position of the turn counter of each condition, see Status.turns.
+CONDITION_INDEX = {condition: index for index, condition in enumerate(Condition)}
@@ -3,6 +3,8 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Optional
 
 from components.base_component import BaseComponent
+from components.condition_types import Condition
+from components.damage_types import DamageType
 from utility_files.exceptions import Impossible
 from actions_logic.input_handlers import ActionOrHandler, AreaRangedAttackHandler, SingleRangedAttackHandler
 import actions_logic.actions as actions
@@ -16,6 +18,8 @@ if TYPE_CHECKING:
 
 
 class Consumable(BaseComponent):
+    __slots__ = ()
+
     parent: Item
 
     def get_action(self, consumer: Actor) -> Optional[ActionOrHandler]:
@@ -38,6 +42,8 @@ class Consumable(BaseComponent):
 
 
 class ConfusionConsumable(Consumable):
+    __slots__ = ()
+
     def get_action(self, consumer: Actor) -> SingleRangedAttackHandler:
         self.engine.message_log.add_message("Select a target location.", color.needs_target)
         return SingleRangedAttackHandler(
@@ -60,11 +66,12 @@ class ConfusionConsumable(Consumable):
             f"The eyes of the {target.name} look vacant, as it starts to stumble around!",
             color.status_effect_applied,
         )
-        target.status.dict_condition_afflicted["confusion"] = True
-        target.status.dict_turns_passed["confusion"] = 0
+        target.status.afflict(Condition.CONFUSION)
         self.consume()
 
 class FearConsumable(Consumable):
+    __slots__ = ()
+
     def get_action(self, consumer: Actor) -> SingleRangedAttackHandler:
         self.engine.message_log.add_message("Select a target location.", color.needs_target)
         return SingleRangedAttackHandler(
@@ -87,12 +94,13 @@ class FearConsumable(Consumable):
             f"The face of the {target.name} look scared, as it starts to run away from you!",
             color.status_effect_applied,
         )
-        target.status.dict_condition_afflicted["fear"] = True
-        target.status.dict_turns_passed["fear"] = 0
+        target.status.afflict(Condition.FEAR)
         self.consume()
 
 
 class FireballDamageConsumable(Consumable):
+    __slots__ = ("damage", "radius")
+
     def __init__(self, damage: int, radius: int):
         self.damage = damage
         self.radius = radius
@@ -112,13 +120,16 @@ class FireballDamageConsumable(Consumable):
             raise Impossible("You cannot target an area that you cannot see.")
 
         targets_hit = False
-        for actor in self.engine.game_map.actors:
-            if actor.distance(*target_xy) <= self.radius:
-                self.engine.message_log.add_message(
-                    f"The {actor.name} is engulfed in a fiery explosion, taking {self.damage} damage!"
-                )
-                actor.fighter.take_damage(self.damage)
-                targets_hit = True
+        store = self.engine.game_map.actor_store
+        rows = store.rows_in_radius(*target_xy, self.radius)
+        # The damage of every target is resolved at once, before anyone dies.
+        damages = store.damage_taken(rows, self.damage, DamageType.NONE)
+        for actor, damage in zip(store.get_actors(rows), damages):
+            self.engine.message_log.add_message(
+                f"The {actor.name} is engulfed in a fiery explosion, taking {damage:g} damage!"
+            )
+            actor.fighter.take_damage(damage)
+            targets_hit = True
 
         if not targets_hit:
             raise Impossible("There are no targets in the radius.")
@@ -126,6 +137,8 @@ class FireballDamageConsumable(Consumable):
 
 
 class HealingConsumable(Consumable):
+    __slots__ = ("amount",)
+
     def __init__(self, amount: int):
         self.amount = amount
 
@@ -144,20 +157,19 @@ class HealingConsumable(Consumable):
 
 
 class HealingStatusConsumable(Consumable):
+    __slots__ = ("amount",)
+
     def __init__(self, amount: int):
         self.amount = amount
     
     def activate(self, action: actions.ItemAction) -> None:
         consumer = action.entity
         amount_recovered = consumer.fighter.heal(self.amount)
-        flag_status = consumer.status.dict_condition_afflicted["bleed"] or consumer.status.dict_condition_afflicted["poison"] or consumer.status.dict_condition_afflicted["condemnation"] or consumer.status.dict_condition_afflicted["petrification"] or consumer.status.dict_condition_afflicted["blindness"]
+        cured = Condition.BLEED | Condition.POISON | Condition.CONDEMNATION | Condition.PETRIFICATION | Condition.BLINDNESS
+        flag_status = consumer.status.afflicted & cured
         
         if amount_recovered > 0 or flag_status:
-            consumer.status.dict_condition_afflicted["bleed"] = False
-            consumer.status.dict_condition_afflicted["poison"] = False
-            consumer.status.dict_condition_afflicted["condemnation"] = False
-            consumer.status.dict_condition_afflicted["petrification"] = False
-            consumer.status.dict_condition_afflicted["blindness"] = False
+            consumer.status.cure(cured)
             self.engine.message_log.add_message(
                 f"You are healed from your affliction!",
                 color.health_recovered,
@@ -168,22 +180,17 @@ class HealingStatusConsumable(Consumable):
 
 
 class LightningDamageConsumable(Consumable):
+    __slots__ = ("damage", "maximum_range")
+
     def __init__(self, damage: int, maximum_range: int):
         self.damage = damage
         self.maximum_range = maximum_range
 
     def activate(self, action: actions.ItemAction) -> None:
         consumer = action.entity
-        target = None
-        closest_distance = self.maximum_range + 1.0
-
-        for actor in self.engine.game_map.actors:
-            if actor is not consumer and self.parent.gamemap.visible[actor.x, actor.y]:
-                distance = consumer.distance(actor.x, actor.y)
-
-                if distance < closest_distance:
-                    target = actor
-                    closest_distance = distance
+        target = self.engine.game_map.get_nearest_actor(
+            consumer.x, consumer.y, self.maximum_range + 1, exclude=consumer, visible_only=True, strict=True
+        )
 
         if target:
             self.engine.message_log.add_message(
@@ -194,7 +201,9 @@ class LightningDamageConsumable(Consumable):
         else:
             raise Impossible("No enemy is close enough to strike.")
 
-class StunConsumable(Consumable):    
+class StunConsumable(Consumable):
+    __slots__ = ()
+
     def get_action(self, consumer: actions.Actor) -> SingleRangedAttackHandler:
         self.engine.message_log.add_message("Select a target location.", color.needs_target)
         return SingleRangedAttackHandler(
@@ -217,6 +226,5 @@ class StunConsumable(Consumable):
             f"The {target.name} is trying to focus, but it can't!",
             color.status_effect_applied,
         )
-        target.status.dict_condition_afflicted["stun"] = True
-        target.status.dict_turns_passed["stun"] = 0
+        target.status.afflict(Condition.STUN)
         self.consume()
\ No newline at end of file
@@ -0,0 +1,9 @@
+from enum import IntEnum
+
+class DamageType(IntEnum):
+    """Elements of an attack, each one is an index in DamageInfo.multipliers."""
+    NONE = 0
+    FIRE = 1
+    ICE = 2
+    ELECTRIC = 3
+    ACID = 4
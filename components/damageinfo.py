@@ -4,11 +4,17 @@ from typing import TYPE_CHECKING, Tuple, Optional
 import random
 
 from components.base_component import BaseComponent
+from components.damage_types import DamageType
+from components.species import Species, species_field
 
 if TYPE_CHECKING:
     from entity.entity import Actor
 
 class DamageInfo(BaseComponent):
+    """Elemental affinities of an actor, they belong to its species and are fixed once it is built."""
+
+    __slots__ = ("species",)
+
     parent: Actor
 
     def __init__(self, 
@@ -18,57 +24,45 @@ class DamageInfo(BaseComponent):
                  fire_attack: bool = False, ice_attack: bool = False, electric_attack: bool = False, acid_attack: bool = False,
     ):
         
-        self.dict_damage_resistance = dict(fire = fire_resistance, ice = ice_resistance, electric = electric_resistance, acid = acid_resistance)
-        self.dict_damage_immunity = dict(fire = fire_immunity, ice = ice_immunity, electric = electric_immunity, acid = acid_immunity)
-        self.dict_damage_vulnerabiliy = dict(fire = fire_vulnerability, ice = ice_vulnerability, electric = electric_vulnerability, acidy = acid_vulnerability)
-        self.dict_damage_attack = dict(fire = fire_attack, ice = ice_attack, electric = electric_attack, acid = acid_attack)
+        dict_damage_resistance = dict(fire = fire_resistance, ice = ice_resistance, electric = electric_resistance, acid = acid_resistance)
+        dict_damage_immunity = dict(fire = fire_immunity, ice = ice_immunity, electric = electric_immunity, acid = acid_immunity)
+        dict_damage_vulnerabiliy = dict(fire = fire_vulnerability, ice = ice_vulnerability, electric = electric_vulnerability, acid = acid_vulnerability)
+        dict_damage_attack = dict(fire = fire_attack, ice = ice_attack, electric = electric_attack, acid = acid_attack)
 
-    def attack_type_return(self) -> str:
-        if self.dict_damage_attack["fire"]:
-            return "fire"
-        elif self.dict_damage_attack["ice"]:
-            return "ice"
-        elif self.dict_damage_attack["electric"]:
-            return "electric"
-        elif self.dict_damage_attack["acid"]:
-            return "acid"
-        else:
-            return ""
-    
-    def calculate_damage(self, damage_type: str) -> float:
-        match damage_type:
-            case "fire":
-                if self.dict_damage_resistance["fire"]:
-                    return 0.5
-                elif self.dict_damage_immunity["fire"]:
-                    return 0
-                elif self.dict_damage_vulnerabiliy["fire"]:
-                    return 2
-                return 1
-            case "ice":
-                if self.dict_damage_resistance["ice"]:
-                    return 0.5
-                elif self.dict_damage_immunity["ice"]:
-                    return 0
-                elif self.dict_damage_vulnerabiliy["ice"]:
-                    return 2
-                return 1
-            case "electric":
-                if self.dict_damage_resistance["electric"]:
-                    return 0.5
-                elif self.dict_damage_immunity["electric"]:
-                    return 0
-                elif self.dict_damage_vulnerabiliy["electric"]:
-                    return 2
-                return 1
-            case "acid":
-                if self.dict_damage_resistance["acid"]:
-                    return 0.5
-                elif self.dict_damage_immunity["acid"]:
-                    return 0
-                elif self.dict_damage_vulnerabiliy["acid"]:
-                    return 2
-                return 1
-            case _:
-                return 1
+        # Damage multiplier of each damage type.
+        multipliers = [1] * len(DamageType)
+        attack_type = DamageType.NONE
+        for damage_type in list(DamageType)[1:]:
+            name = damage_type.name.lower()
+            if dict_damage_resistance[name]:
+                multipliers[damage_type] = 0.5
+            elif dict_damage_immunity[name]:
+                multipliers[damage_type] = 0
+            elif dict_damage_vulnerabiliy[name]:
+                multipliers[damage_type] = 2
+            # The first element an actor attacks with wins.
+            if dict_damage_attack[name] and attack_type is DamageType.NONE:
+                attack_type = damage_type
 
+        self.species = Species(
+            dict_damage_resistance=dict_damage_resistance,
+            dict_damage_immunity=dict_damage_immunity,
+            dict_damage_vulnerabiliy=dict_damage_vulnerabiliy,
+            dict_damage_attack=dict_damage_attack,
+            attack_type=attack_type,
+            multipliers=tuple(multipliers),  # Ints unless resistant, hit points stay whole.
+        )
+
+    dict_damage_resistance = species_field("dict_damage_resistance")
+    dict_damage_immunity = species_field("dict_damage_immunity")
+    dict_damage_vulnerabiliy = species_field("dict_damage_vulnerabiliy")
+    dict_damage_attack = species_field("dict_damage_attack")
+    attack_type = species_field("attack_type")
+    multipliers = species_field("multipliers")
+
+    def attack_type_return(self) -> DamageType:
+        return self.attack_type
+    
+    def calculate_damage(self, damage_type: DamageType) -> float:
+        """Return the multiplier of the damage this actor takes from an attack of the given type."""
+        return self.multipliers[damage_type]
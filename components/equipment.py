@@ -10,6 +10,8 @@ if TYPE_CHECKING:
 
 
 class Equipment(BaseComponent):
+    __slots__ = ("meelee", "ranged", "armor", "accessory_1", "accessory_2")
+
     parent: Actor
 
     def __init__(self, meelee: Optional[Item] = None, ranged: Optional[Item] = None, armor: Optional[Item] = None, 
@@ -20,6 +22,23 @@ class Equipment(BaseComponent):
         self.accessory_1 = accessory_1
         self.accessory_2 = accessory_2
 
+    def clone(self, parent: Actor) -> Equipment:
+        """Return a copy of this equipment for another actor, whose inventory must already be cloned.
+
+        Equipped items are taken from the inventory of that actor, so it wears its own copies.
+        """
+        clone = super().clone(parent)
+        items = self.parent.inventory.items
+        for slot in self.__slots__:
+            item = getattr(self, slot)
+            if item is None:
+                continue
+            if item in items:
+                setattr(clone, slot, parent.inventory.items[items.index(item)])
+            else:
+                setattr(clone, slot, item.clone())
+        return clone
+
     @property
     def defense_bonus(self) -> int:
         bonus = 0
@@ -133,6 +152,7 @@ class Equipment(BaseComponent):
             self.unequip_from_slot(slot, add_message)
 
         setattr(self, slot, item)
+        self.parent.fighter.invalidate_stats()
 
         if add_message:
             self.equip_message(item.name)
@@ -144,6 +164,7 @@ class Equipment(BaseComponent):
             self.unequip_message(current_item.name)
 
         setattr(self, slot, None)
+        self.parent.fighter.invalidate_stats()
 
     def toggle_equip(self, equippable_item: Item, add_message: bool = True) -> None:
         if equippable_item.equippable and equippable_item.equippable.equipment_type == EquipmentType.MEELEE:
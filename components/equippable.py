@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any
 
 from components.base_component import BaseComponent
+from components.damage_types import DamageType
 from components.equipment_types import EquipmentType
 
 if TYPE_CHECKING:
@@ -10,6 +11,8 @@ if TYPE_CHECKING:
 
 
 class Equippable(BaseComponent):
+    __slots__ = ("equipment_type", "power_bonus", "defense_bonus", "status_effect", "damage_type", "projectile_name")
+
     parent: Item
 
     def __init__(
@@ -18,7 +21,7 @@ class Equippable(BaseComponent):
         power_bonus: int = 0,
         defense_bonus: int = 0,
         status_effect: str = "",
-        damage_type: str = "",
+        damage_type: DamageType = DamageType.NONE,
         projectile_name: str = "",
     ):
         self.equipment_type = equipment_type
@@ -32,65 +35,95 @@ class Equippable(BaseComponent):
 
 
 class Dagger(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.MEELEE, power_bonus=2)
 
 class Sword(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.MEELEE, power_bonus=4)
 
 class VorpalSword(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.MEELEE, power_bonus=4, status_effect="bleed")
 
 class PoisonSword(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.MEELEE, power_bonus=4, status_effect="poison")
 
 class FireSword(Equippable):
+    __slots__ = ()
+
     def __init__(self):
-        super().__init__(equipment_type=EquipmentType.MEELEE, power_bonus=4, damage_type="fire")
+        super().__init__(equipment_type=EquipmentType.MEELEE, power_bonus=4, damage_type=DamageType.FIRE)
 
 class IceSword(Equippable):
+    __slots__ = ()
+
     def __init__(self):
-        super().__init__(equipment_type=EquipmentType.MEELEE, power_bonus=4, damage_type="ice")
+        super().__init__(equipment_type=EquipmentType.MEELEE, power_bonus=4, damage_type=DamageType.ICE)
         
 class ElectricSword(Equippable):
+    __slots__ = ()
+
     def __init__(self):
-        super().__init__(equipment_type=EquipmentType.MEELEE, power_bonus=4, damage_type="electric")
+        super().__init__(equipment_type=EquipmentType.MEELEE, power_bonus=4, damage_type=DamageType.ELECTRIC)
 
 
 class Bow(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.RANGED, power_bonus=2, projectile_name="arrow")
 
 class Kunai(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.RANGED, power_bonus=1, status_effect="bleed", projectile_name="kunai")
 
 
 class LeatherArmor(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.ARMOR, defense_bonus=1)
 
 class ChainMail(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.ARMOR, defense_bonus=3)
 
 
 class AttackRing(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.ACCESSORY, power_bonus=3)
 
 class DefenseRing(Equippable):
+    __slots__ = ()
+
     def __init__(self) -> None:
         super().__init__(equipment_type=EquipmentType.ACCESSORY, defense_bonus=3)
 
 class VorpalAttackRing(Equippable):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(equipment_type=EquipmentType.ACCESSORY, power_bonus=2, status_effect="bleed")
 
 class PoisonAttackRing(Equippable):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(equipment_type=EquipmentType.ACCESSORY, power_bonus=2, status_effect="poison")
 
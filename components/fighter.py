@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional, Tuple
 
 from components.base_component import BaseComponent
 from render_logic.render_order import RenderOrder
@@ -11,13 +11,21 @@ if TYPE_CHECKING:
 
 
 class Fighter(BaseComponent):
+    __slots__ = ("_hp", "_max_hp", "_base_defense", "_base_power", "_derived_stats")
+
     parent: Actor
 
+    # Derived stats statistics of every fighter, to measure how often the cache saves a recompute.
+    stats_hits: int = 0
+    stats_recomputes: int = 0
+
     def __init__(self, hp: int, base_defense: int, base_power: int):
-        self.max_hp = hp
+        self._max_hp = hp
         self._hp = hp
-        self.base_defense = base_defense
-        self.base_power = base_power
+        self._base_defense = base_defense
+        self._base_power = base_power
+        # (defense, power_meelee, power_ranged), None until needed again, see invalidate_stats.
+        self._derived_stats: Optional[Tuple[int, int, int]] = None
 
     @property
     def hp(self) -> int:
@@ -26,20 +34,91 @@ class Fighter(BaseComponent):
     @hp.setter
     def hp(self, value: int) -> None:
         self._hp = max(0, min(value, self.max_hp))
+        store = self.parent.store
+        if store is not None:
+            store.hp[self.parent.store_row] = self._hp
         if self._hp == 0 and self.parent.ai:
             self.die()
 
+    @property
+    def max_hp(self) -> int:
+        return self._max_hp
+
+    @max_hp.setter
+    def max_hp(self, value: int) -> None:
+        self._max_hp = value
+        store = self.parent.store
+        if store is not None:
+            store.max_hp[self.parent.store_row] = value
+
+    @property
+    def base_defense(self) -> int:
+        return self._base_defense
+
+    @base_defense.setter
+    def base_defense(self, value: int) -> None:
+        self._base_defense = value
+        self.invalidate_stats()
+
+    @property
+    def base_power(self) -> int:
+        return self._base_power
+
+    @base_power.setter
+    def base_power(self, value: int) -> None:
+        self._base_power = value
+        self.invalidate_stats()
+
+    def invalidate_stats(self) -> None:
+        """Forget the cached defense and power.
+
+        Call it after anything changing the defense or power bonuses, like equipping or damaging an item.
+        The actor store gets the new values when they are computed again.
+        """
+        self._derived_stats = None
+
+    def update_store(self) -> None:
+        """Copy all the stats of this fighter to the actor store of its map, if it's on one."""
+        store = self.parent.store
+        if store is not None:
+            row = self.parent.store_row
+            store.hp[row] = self._hp
+            store.max_hp[row] = self._max_hp
+            store.defense[row] = self.defense
+            store.power[row] = self.power_meelee
+
+    @property
+    def derived_stats(self) -> Tuple[int, int, int]:
+        """Return (defense, power_meelee, power_ranged), recomputed only after invalidate_stats."""
+        if self._derived_stats is None:
+            Fighter.stats_recomputes += 1
+            self._derived_stats = self.compute_stats()
+            store = self.parent.store
+            if store is not None:
+                row = self.parent.store_row
+                store.defense[row], store.power[row] = self._derived_stats[:2]
+        else:
+            Fighter.stats_hits += 1
+        return self._derived_stats
+
+    def compute_stats(self) -> Tuple[int, int, int]:
+        return (
+            self.base_defense + self.defense_bonus,
+            self.base_power + self.power_meelee_bonus,
+            self.base_power + self.power_ranged_bonus,
+        )
+
     @property
     def defense(self) -> int:
-        return self.base_defense + self.defense_bonus
+        return self.derived_stats[0]
 
     @property
     def power_meelee(self) -> int:
-        return self.base_power + self.power_meelee_bonus
+        return self.derived_stats[1]
     
     @property
     def power_ranged(self) -> int:
-        return self.base_power + self.power_ranged_bonus
+        return self.derived_stats[2]
 
     @property
     def defense_bonus(self) -> int:
@@ -74,8 +153,9 @@ class Fighter(BaseComponent):
         self.parent.color = (191, 0, 0)
         self.parent.blocks_movement = False
         self.parent.ai = None
+        self.gamemap.mark_dead(self.parent)
         self.parent.name = f"remains of {self.parent.name}"
-        self.parent.render_order = RenderOrder.CORPSE
+        self.gamemap.set_render_order(self.parent, RenderOrder.CORPSE)
 
         self.engine.message_log.add_message(death_message, death_message_color)
 
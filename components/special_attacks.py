@@ -4,11 +4,16 @@ from typing import TYPE_CHECKING, Tuple, Optional
 import random
 
 from components.base_component import BaseComponent
+from components.species import Species, species_field
 
 if TYPE_CHECKING:
     from entity.entity import Actor
 
 class SpecialAttacks(BaseComponent):
+    """Special attacks of an actor, what it can do belongs to its species, the state of the attacks to the actor."""
+
+    __slots__ = ("dict_special_attack_status", "dict_turns_recharge", "dict_turns_effect", "species")
+
     parent: Actor
     turns_to_recharge: int = 5
 
@@ -19,16 +24,34 @@ class SpecialAttacks(BaseComponent):
                  status_ingested: bool = False, status_ingesting: bool = False,
                  immunity_ingest: bool = False, immunity_percentile: bool = False, immunity_stats_drain: bool = False, immunity_rot: bool = False, immunity_steal: bool = False, immunity_dispel: bool = False, immunity_corrosion: bool = False,
                 ) -> None:
-        self.dict_special_attacks_flag = dict(ingest = flag_ingest, percentile = flag_percentile, stats_drain = flag_stats_drain, rot = flag_rot, steal = flag_steal, dispel = flag_dispel,
-                                              corrosion = flag_corrosion, armor_pen = flag_armor_penetrating,)
-        self.dict_special_attack_values = dict(percentile = values_percentile, strenght_drain = value_strenght_drain, agility_drain = value_agility_drain,)
-        self.dict_special_attack_damage = dict(ingest = damage_ingest, stats_drain = damage_stat_drain, rot = damage_rot, steal = damage_steal, dispel = damage_dispel, 
-                                               corrosion = damage_corrosion,)
+        dict_special_attacks_flag = dict(ingest = flag_ingest, percentile = flag_percentile, stats_drain = flag_stats_drain, rot = flag_rot, steal = flag_steal, dispel = flag_dispel,
+                                         corrosion = flag_corrosion, armor_pen = flag_armor_penetrating,)
+        dict_special_attack_values = dict(percentile = values_percentile, strenght_drain = value_strenght_drain, agility_drain = value_agility_drain,)
+        dict_special_attack_damage = dict(ingest = damage_ingest, stats_drain = damage_stat_drain, rot = damage_rot, steal = damage_steal, dispel = damage_dispel, 
+                                          corrosion = damage_corrosion,)
         self.dict_special_attack_status = dict(ingested = status_ingested, ingesting = status_ingesting,)
-        self.dict_special_attack_immunity = dict(ingest = immunity_ingest, percentile = immunity_percentile, stats_drain = immunity_stats_drain, rot = immunity_rot, 
-                                                 steal = immunity_steal, dispel = immunity_dispel, corrosion = immunity_corrosion,)
+        dict_special_attack_immunity = dict(ingest = immunity_ingest, percentile = immunity_percentile, stats_drain = immunity_stats_drain, rot = immunity_rot, 
+                                            steal = immunity_steal, dispel = immunity_dispel, corrosion = immunity_corrosion,)
+        self.species = Species(
+            dict_special_attacks_flag=dict_special_attacks_flag,
+            dict_special_attack_values=dict_special_attack_values,
+            dict_special_attack_damage=dict_special_attack_damage,
+            dict_special_attack_immunity=dict_special_attack_immunity,
+        )
         self.dict_turns_recharge = dict(ingest = 0, percentile = 0, stats_drain = 0, rot = 0, steal = 0, dispel = 0, corrosion = 0,)
         self.dict_turns_effect = dict(ingest = 0,)
+
+    dict_special_attacks_flag = species_field("dict_special_attacks_flag")
+    dict_special_attack_values = species_field("dict_special_attack_values")
+    dict_special_attack_damage = species_field("dict_special_attack_damage")
+    dict_special_attack_immunity = species_field("dict_special_attack_immunity")
+
+    def clone(self, parent: Actor) -> SpecialAttacks:
+        clone = super().clone(parent)
+        clone.dict_special_attack_status = dict(self.dict_special_attack_status)
+        clone.dict_turns_recharge = dict(self.dict_turns_recharge)
+        clone.dict_turns_effect = dict(self.dict_turns_effect)
+        return clone
     
     @property
     def check_attack_ingest(self) -> bool:
@@ -143,6 +166,7 @@ class SpecialAttacks(BaseComponent):
                         if item.equippable is not None:
                             if item.damaged is False:
                                 item.damaged = True
+                                target.fighter.invalidate_stats()
                             else:
                                 target.equipment.toggle_equip(item, False)
                                 target.inventory.items.remove(item)
@@ -169,6 +193,7 @@ class SpecialAttacks(BaseComponent):
                         if item.equippable is not None:
                             if item.damaged is False:
                                 item.damaged = True
+                                target.fighter.invalidate_stats()
                             else:
                                 target.equipment.toggle_equip(item, False)
                                 target.inventory.items.remove(item)
@@ -200,6 +225,7 @@ class SpecialAttacks(BaseComponent):
                         if item.equippable is not None:
                             if item.damaged is False:
                                 item.damaged = True
+                                target.fighter.invalidate_stats()
                             else:
                                 target.equipment.toggle_equip(item, False)
                                 target.inventory.items.remove(item)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+from typing import Any, Dict, Optional
+
+
+class Species:
+    """Data shared by every actor of a kind that never changes during a game: condition immunities and attacks,
+    elemental affinities, special attacks.
+
+    The actors of a kind all point at the same read-only instance, their components only hold the per-instance
+    state (hit points, turn counters, afflictions). Saves store the name of the species, and look it up in the
+    registry when loaded.
+
+    The Status, DamageInfo and SpecialAttacks of a prototype each start with an unnamed species holding their part
+    of the fields, the Actor merges them into the registered species of its kind, see define.
+    """
+
+    __slots__ = (
+        "name",
+        # Status
+        "immune",
+        "attack",
+        # DamageInfo
+        "dict_damage_attack",
+        "dict_damage_immunity",
+        "dict_damage_resistance",
+        "dict_damage_vulnerabiliy",
+        "attack_type",
+        "multipliers",
+        # SpecialAttacks
+        "dict_special_attacks_flag",
+        "dict_special_attack_values",
+        "dict_special_attack_damage",
+        "dict_special_attack_immunity",
+    )
+
+    def __init__(self, name: Optional[str] = None, **fields: Any):
+        object.__setattr__(self, "name", name)
+        for field, value in fields.items():
+            if isinstance(value, dict):
+                value = MappingProxyType(value)
+            object.__setattr__(self, field, value)
+
+    def __setattr__(self, field: str, value: Any) -> None:
+        raise AttributeError(f"Species are shared by every actor of a kind, {field} can't be changed.")
+
+    def __reduce__(self):
+        if self.name is None:
+            raise TypeError("Only the species of an actor can be saved.")
+        return get, (self.name,)
+
+    def fields(self) -> Dict[str, Any]:
+        """Return the fields set on this species, by name."""
+        return {field: getattr(self, field) for field in self.__slots__[1:] if hasattr(self, field)}
+
+
+def species_field(field: str) -> property:
+    """Return a read-only property of a component reading a field of its species."""
+    return property(lambda component: getattr(component.species, field))
+
+
+_species: Dict[str, Species] = {}
+
+
+def define(name: str, *parts: Species) -> Species:
+    """Return the species of the given name, merging the fields of the parts into it the first time.
+
+    Defining a species again with other fields is an error, actors sharing a name must share their data.
+    """
+    fields: Dict[str, Any] = {}
+    for part in parts:
+        fields.update(part.fields())
+
+    species = _species.get(name)
+    if species is None:
+        species = _species[name] = Species(name, **fields)
+    elif species.fields() != fields:
+        raise ValueError(f"The species {name!r} is already defined with other values.")
+    return species
+
+
+def get(name: str) -> Species:
+    return _species[name]
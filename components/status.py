@@ -1,15 +1,92 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Tuple, Optional
+from typing import TYPE_CHECKING, Iterator, Tuple, Optional
+from collections.abc import MutableMapping
 import random
 
 from components.base_component import BaseComponent
+from components.condition_types import CONDITION_INDEX, Condition
+from components.species import Species, species_field
+import utility_files.tracing as tracing
 
 if TYPE_CHECKING:
     from entity.entity import Actor
     from game_logic.engine import Engine
 
+def conditions_mask(**flags: bool) -> int:
+    """Return the mask of the conditions whose keyword is True, e.g. conditions_mask(fear=True)."""
+    mask = 0
+    for name, flag in flags.items():
+        if flag:
+            mask |= Condition[name.upper()]
+    return mask
+
+
+class ConditionFlags(MutableMapping):
+    """Dict-like view of one of the condition masks of a Status, for code still using condition names.
+
+    Reading and writing it goes through the mask, so it always agrees with the flags.
+    """
+
+    __slots__ = ("status", "attribute")
+
+    def __init__(self, status: Status, attribute: str):
+        self.status = status
+        self.attribute = attribute
+
+    def __getitem__(self, condition: str) -> bool:
+        return bool(getattr(self.status, self.attribute) & Condition[condition.upper()])
+
+    def __setitem__(self, condition: str, flag: bool) -> None:
+        mask = getattr(self.status, self.attribute)
+        if flag:
+            mask |= Condition[condition.upper()]
+        else:
+            mask &= ~Condition[condition.upper()]
+        setattr(self.status, self.attribute, mask)
+
+    def __delitem__(self, condition: str) -> None:
+        raise TypeError("Conditions can't be removed, set them to False instead.")
+
+    def __iter__(self) -> Iterator[str]:
+        return (condition.name.lower() for condition in Condition)
+
+    def __len__(self) -> int:
+        return len(Condition)
+
+
+class TurnCounters(MutableMapping):
+    """Dict-like view of the turn counters of a Status, keyed by condition name."""
+
+    __slots__ = ("status",)
+
+    def __init__(self, status: Status):
+        self.status = status
+
+    def __getitem__(self, condition: str) -> int:
+        return self.status.turns[CONDITION_INDEX[Condition[condition.upper()]]]
+
+    def __setitem__(self, condition: str, turns: int) -> None:
+        self.status.turns[CONDITION_INDEX[Condition[condition.upper()]]] = turns
+
+    def __delitem__(self, condition: str) -> None:
+        raise TypeError("Turn counters can't be removed, set them to 0 instead.")
+
+    def __iter__(self) -> Iterator[str]:
+        return (condition.name.lower() for condition in Condition)
+
+    def __len__(self) -> int:
+        return len(Condition)
+
+
 class Status(BaseComponent):
+    """The conditions of an actor, as bit masks of Condition, with one turn counter per condition.
+
+    The immunities and the conditions the actor attacks with belong to its species.
+    """
+
+    __slots__ = ("_afflicted", "turns", "species")
+
     parent: Actor
 
     damage_bleed: int = 1
@@ -30,121 +107,180 @@ class Status(BaseComponent):
                  immunity_bleed: bool = False, immunity_poison: bool = False, immunity_stun: bool = False, immunity_confusion: bool = False, immunity_grab: bool = False, immunity_condemnation: bool = False, immunity_petrification: bool = False, immunity_fear: bool = False, immunity_blindness: bool = False,  immunity_charm: bool = False, immunity_rage: bool = False,
                  attack_bleed: bool = False, attack_poison: bool = False, attack_stun: bool = False, attack_confusion: bool = False, attack_grab: bool = False, attack_condemnation: bool = False, attack_petrification: bool = False, attack_fear: bool = False, attack_blindness: bool = False, attack_charm: bool = False, attack_rage: bool = False,
     ):
-        self.dict_condition_afflicted = dict(bleed = flag_bleed, poison = flag_poison, stun = flag_stun, confusion = flag_confusion, grab = flag_grab, 
-                                             condemnation = flag_condemnation, petrification = flag_petrification, fear = flag_fear, blindness = flag_blindness,
-                                             charm = flag_charm, rage = flag_rage)
-
-        self.dict_condition_immunity = dict(bleed = immunity_bleed, poison = immunity_poison, stun = immunity_stun, confusion = immunity_confusion, 
-                                            grab = immunity_grab, condemnation = immunity_condemnation, petrification = immunity_petrification, 
-                                            fear = immunity_fear, blindness = immunity_blindness, charm = immunity_charm, rage = immunity_rage
-                                            )
-
-        self.dict_condition_attack = dict(bleed = attack_bleed, poison = attack_poison, stun = attack_stun, confusion = attack_confusion, grab = attack_grab,
-                                          condemnation = attack_condemnation, petrification = attack_petrification, fear = attack_fear, blindness = attack_blindness,
-                                          charm = attack_charm, rage = attack_rage)
-        
-        self.dict_turns_passed = dict(poison = 0, burn = 0, stun = 0, confusion = 0, grab = 0, condemnation = 0, petrification = 0, fear = 0, charm = 0, rage = 0,)
+        self._afflicted = conditions_mask(bleed = flag_bleed, poison = flag_poison, stun = flag_stun, confusion = flag_confusion, grab = flag_grab, 
+                                          condemnation = flag_condemnation, petrification = flag_petrification, fear = flag_fear, blindness = flag_blindness,
+                                          charm = flag_charm, rage = flag_rage)
+
+        immune = conditions_mask(bleed = immunity_bleed, poison = immunity_poison, stun = immunity_stun, confusion = immunity_confusion, 
+                                      grab = immunity_grab, condemnation = immunity_condemnation, petrification = immunity_petrification, 
+                                      fear = immunity_fear, blindness = immunity_blindness, charm = immunity_charm, rage = immunity_rage
+                                      )
+
+        attack = conditions_mask(bleed = attack_bleed, poison = attack_poison, stun = attack_stun, confusion = attack_confusion, grab = attack_grab,
+                                      condemnation = attack_condemnation, petrification = attack_petrification, fear = attack_fear, blindness = attack_blindness,
+                                      charm = attack_charm, rage = attack_rage)
+        self.species = Species(immune=immune, attack=attack)
+
+        # Turns passed since each condition was afflicted, indexed by CONDITION_INDEX.
+        self.turns = [0] * len(Condition)
+
+    def clone(self, parent: Actor) -> Status:
+        clone = super().clone(parent)
+        clone.turns = list(self.turns)
+        return clone
+
+    immune = species_field("immune")
+    attack = species_field("attack")
+
+    @property
+    def afflicted(self) -> int:
+        return self._afflicted
+
+    @afflicted.setter
+    def afflicted(self, mask: int) -> None:
+        self._afflicted = mask
+        # The parent is missing while the prototypes are built.
+        actor = getattr(self, "parent", None)
+        if actor is not None and actor.store is not None:
+            actor.store.conditions[actor.store_row] = mask
+
+    def afflict(self, condition: Condition) -> None:
+        """Afflict the actor with a condition, starting its turn counter from 0."""
+        self.afflicted = self._afflicted | condition
+        self.turns[CONDITION_INDEX[condition]] = 0
+
+    def cure(self, conditions: int) -> None:
+        """Remove every condition of the mask, resetting their turn counters."""
+        self.afflicted = self._afflicted & ~conditions
+        for condition in Condition:
+            if conditions & condition:
+                self.turns[CONDITION_INDEX[condition]] = 0
+
+    def tick(self, condition: Condition) -> None:
+        self.turns[CONDITION_INDEX[condition]] += 1
+
+    def reset_turns(self, condition: Condition) -> None:
+        self.turns[CONDITION_INDEX[condition]] = 0
+
+    def turns_passed(self, condition: Condition) -> int:
+        return self.turns[CONDITION_INDEX[condition]]
+
+    @property
+    def dict_condition_afflicted(self) -> ConditionFlags:
+        return ConditionFlags(self, "afflicted")
+
+    @property
+    def dict_condition_immunity(self) -> ConditionFlags:
+        return ConditionFlags(self, "immune")
+
+    @property
+    def dict_condition_attack(self) -> ConditionFlags:
+        return ConditionFlags(self, "attack")
+
+    @property
+    def dict_turns_passed(self) -> TurnCounters:
+        return TurnCounters(self)
     
     @property
     def check_turns_poison(self) -> bool:
-        return self.dict_condition_afflicted["poison"] and self.dict_turns_passed["poison"] > self.turns_poison
+        return self._afflicted & Condition.POISON and self.turns_passed(Condition.POISON) > self.turns_poison
         
     @property
     def check_turns_bleed(self) -> bool:
-        return self.dict_condition_afflicted["bleed"] and self.dict_turns_passed["bleed"] > self.turns_bleed
+        return self._afflicted & Condition.BLEED and self.turns_passed(Condition.BLEED) > self.turns_bleed
     
     @property
     def check_turns_stun(self) -> bool:
-        return self.dict_turns_passed["stun"] >= self.turns_stun
+        return self.turns_passed(Condition.STUN) >= self.turns_stun
     
     @property
     def check_turns_confusion(self) -> bool:
-        return self.dict_turns_passed["confusion"] > self.turns_confusion
+        return self.turns_passed(Condition.CONFUSION) > self.turns_confusion
     
     @property
     def check_turns_grab(self) -> bool:
-        return self.dict_turns_passed["grab"] > self.turns_grab
+        return self.turns_passed(Condition.GRAB) > self.turns_grab
     
     @property
     def check_turns_condemnation(self) -> bool:
-        return self.dict_condition_afflicted["condemnation"] and self.dict_turns_passed["condemnation"] > self.turns_condemnation
+        return self._afflicted & Condition.CONDEMNATION and self.turns_passed(Condition.CONDEMNATION) > self.turns_condemnation
 
     @property
     def check_turns_petrification(self) -> bool:
-        return self.dict_condition_afflicted["petrification"] and self.dict_turns_passed["petrification"] > self.turns_petrification
+        return self._afflicted & Condition.PETRIFICATION and self.turns_passed(Condition.PETRIFICATION) > self.turns_petrification
     
     @property
-    def check_turns_petrification(self) -> bool:
-        return self.dict_condition_afflicted["fead"] and self.dict_turns_passed["fear"] > self.turns_fear
+    def check_turns_fear(self) -> bool:
+        return self._afflicted & Condition.FEAR and self.turns_passed(Condition.FEAR) > self.turns_fear
     
     @property
     def check_turns_charm(self) -> bool:
-        return self.dict_turns_passed["charm"] > self.turns_charm
+        return self.turns_passed(Condition.CHARM) > self.turns_charm
     
     @property
     def check_turns_rage(self) -> bool:
-        return self.dict_turns_passed["rage"] > self.turns_rage
+        return self.turns_passed(Condition.RAGE) > self.turns_rage
         
     
     @property
     def check_grabbed_condition(self) -> bool:
-        return self.dict_condition_afflicted["grab"]
+        return bool(self._afflicted & Condition.GRAB)
 
 
     @property
     def check_bleed_immunity(self) -> bool:
-        return self.dict_condition_immunity["bleed"]
-    
+        return bool(self.immune & Condition.BLEED)
+
     @property
     def check_poison_immunity(self) -> bool:
-        return self.dict_condition_immunity["poison"]
-    
+        return bool(self.immune & Condition.POISON)
+
     @property
     def check_stun_immunity(self) -> bool:
-        return self.dict_condition_immunity["stun"]
-    
+        return bool(self.immune & Condition.STUN)
+
     @property
     def check_confusion_immunity(self) -> bool:
-        return self.dict_condition_immunity["confusion"]
-    
+        return bool(self.immune & Condition.CONFUSION)
+
     @property
     def check_grab_immunity(self) -> bool:
-        return self.dict_condition_immunity["grab"]
-    
+        return bool(self.immune & Condition.GRAB)
+
     @property
     def check_condemnation_immunity(self) -> bool:
-        return self.dict_condition_immunity["condemnation"]
-    
+        return bool(self.immune & Condition.CONDEMNATION)
+
     @property
     def check_petrification_immunity(self) -> bool:
-        return self.dict_condition_immunity["petrification"]
-    
+        return bool(self.immune & Condition.PETRIFICATION)
+
     @property
     def check_fear_immunity(self) -> bool:
-        return self.dict_condition_immunity["fear"]
-    
+        return bool(self.immune & Condition.FEAR)
+
     @property
     def check_blindness_immunity(self) -> bool:
-        return self.dict_condition_immunity["blindness"]
-    
+        return bool(self.immune & Condition.BLINDNESS)
+
     @property
     def check_charm_immunity(self) -> bool:
-        return self.dict_condition_immunity["charm"]
-    
+        return bool(self.immune & Condition.CHARM)
+
     @property
     def check_rage_immunity(self) -> bool:
-        return self.dict_condition_immunity["rage"]
-    
+        return bool(self.immune & Condition.RAGE)
+
 
     def effect_hp_damage(self) -> None:
-        if self.dict_condition_afflicted["poison"]:
+        if self.afflicted & Condition.BLEED:
             self.parent.fighter.hp -= self.damage_bleed
             self.engine.message_log.add_message(f"You receive {self.damage_bleed} damage from the bleeding!")
-            self.dict_turns_passed["bleed"] = 0
-        if self.dict_condition_afflicted["poison"]:
+            self.reset_turns(Condition.BLEED)
+        if self.afflicted & Condition.POISON:
             self.parent.fighter.hp -= self.damage_poison
             self.engine.message_log.add_message(f"You receive {self.damage_poison} damage from the poison!")
-            self.dict_turns_passed["poison"] = 0
+            self.reset_turns(Condition.POISON)
 
 
     def affect_new_status(self, actor, target, attack_color) -> None:
@@ -153,99 +289,91 @@ class Status(BaseComponent):
         if self.parent.equipment.meelee is None and self.parent.equipment.accessory_1 is None and self.parent.equipment.accessory_2 is None:
             """ If the enemy can affect the player with a condition from an attack, it will not check the other condition. 
                Then, it will check if the player is already afflicted by the condition or if it's immune to the condition."""
-            if self.parent.status.dict_condition_attack["bleed"]:
-                if not target.status.dict_condition_afflicted["bleed"]:
+            if self.parent.status.attack & Condition.BLEED:
+                if not target.status.afflicted & Condition.BLEED:
                     if not target.status.check_bleed_immunity:
-                        target.status.dict_condition_afflicted["bleed"] = True
-                        target.status.dict_turns_passed["bleed"] = 0
+                        target.status.afflict(Condition.BLEED)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is bleeding!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is resistant to bleeding!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already bleeding!", attack_color)
-            if self.parent.status.dict_condition_attack["poison"]:
-                if not target.status.dict_condition_afflicted["poison"]:
+            if self.parent.status.attack & Condition.POISON:
+                if not target.status.afflicted & Condition.POISON:
                     if not target.status.check_poison_immunity:
-                        target.status.dict_condition_afflicted["poison"] = True
-                        target.status.dict_turns_passed["poison"] = 0
+                        target.status.afflict(Condition.POISON)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is poisoned!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is resistant to poison!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already poisoned!", attack_color)
-            if self.parent.status.dict_condition_attack["stun"]:
-                if not target.status.dict_condition_afflicted["stun"]:
+            if self.parent.status.attack & Condition.STUN:
+                if not target.status.afflicted & Condition.STUN:
                     if not target.status.check_stun_immunity:
-                        target.status.dict_condition_afflicted["stun"] = True
-                        target.status.dict_turns_passed["stun"] = 0
+                        target.status.afflict(Condition.STUN)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is stunned!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is resistant to stun!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already stunned!", attack_color)
-            if self.parent.status.dict_condition_attack["confusion"]:
-                if not target.status.dict_condition_afflicted["confusion"]:
+            if self.parent.status.attack & Condition.CONFUSION:
+                if not target.status.afflicted & Condition.CONFUSION:
                     if not target.status.check_confusion_immunity:
-                        target.status.dict_condition_afflicted["confusion"] = True
-                        target.status.dict_turns_passed["confusion"] = 0
+                        target.status.afflict(Condition.CONFUSION)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is confusion!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is resistant to confusion!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already confusion!", attack_color)
-            if self.parent.status.dict_condition_attack["grab"]:
+            if self.parent.status.attack & Condition.GRAB:
                 if not target.status.check_grabbed_condition:
                     if not target.status.check_grab_immunity:
-                        target.status.dict_condition_afflicted["grab"] = True
+                        target.status.afflict(Condition.GRAB)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is grabbed by the {self.parent.name}!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is too agile to be grabbed!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already grabbed by {self.parent.name}!", attack_color)
-            if self.parent.status.dict_condition_attack["condemnation"]:
-                if not target.status.dict_condition_afflicted["condemnation"]:
+            if self.parent.status.attack & Condition.CONDEMNATION:
+                if not target.status.afflicted & Condition.CONDEMNATION:
                     if not target.status.check_condemnation_immunity:
-                        target.status.dict_condition_afflicted["condemnation"] = True
-                        target.status.dict_turns_passed["condemnation"] = 0
+                        target.status.afflict(Condition.CONDEMNATION)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is condemned to die soon!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} death is not predestined now!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already condemned to die!", attack_color)
-            if self.parent.status.dict_condition_attack["petrification"]:
-                if not target.status.dict_condition_afflicted["petrification"]:
+            if self.parent.status.attack & Condition.PETRIFICATION:
+                if not target.status.afflicted & Condition.PETRIFICATION:
                     if not target.status.check_petrification_immunity:
-                        target.status.dict_condition_afflicted["petrification"] = True
-                        target.status.dict_turns_passed["petrification"] = 0
+                        target.status.afflict(Condition.PETRIFICATION)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is slowly turning to stone!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is too strong to be affected!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already turning to stone!", attack_color)
-            if self.parent.status.dict_condition_attack["charm"]:
-                if not target.status.dict_condition_afflicted["charm"]:
+            if self.parent.status.attack & Condition.CHARM:
+                if not target.status.afflicted & Condition.CHARM:
                     if not target.status.check_charm_immunity:
-                        target.status.dict_condition_afflicted["charm"] = True
-                        target.status.dict_turns_passed["charm"] = 0
+                        target.status.afflict(Condition.CHARM)
                         self.parent.gamemap.engine.message_log.add_message(f"You are charmed by your enemy!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"You are too strong willed to be charmed!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"You are already charmed by your enemy!", attack_color)
-            if self.parent.status.dict_condition_attack["fear"]:
-                if not target.status.dict_condition_afflicted["fear"]:
+            if self.parent.status.attack & Condition.FEAR:
+                if not target.status.afflicted & Condition.FEAR:
                     if not target.status.check_fear_immunity:
-                        target.status.dict_condition_afflicted["fear"] = True
-                        target.status.dict_turns_passed["fear"] = 0
+                        target.status.afflict(Condition.FEAR)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is afraid of his enemy!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is too strong willed to be afraid!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already afraid of his enemy!", attack_color)
-            if self.parent.status.dict_condition_attack["blindness"]:
-                if not target.status.dict_condition_afflicted["blindness"]:
+            if self.parent.status.attack & Condition.BLINDNESS:
+                if not target.status.afflicted & Condition.BLINDNESS:
                     if not target.status.check_blindness_immunity:
-                        target.status.dict_condition_afflicted["blindness"] = True
+                        target.status.afflict(Condition.BLINDNESS)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} eyes are clouded!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} eyes are too sharp!", attack_color)
@@ -255,79 +383,77 @@ class Status(BaseComponent):
         else:
             """Check if the equipment of the player can create the conditions specified. 
                Then, it will check if the monster is already afflicted by the condition or if it's immune to the condition."""
-            if ((self.parent.equipment.meelee is not None and self.parent.equipment.meelee.equippable.status_effect == "bleed") or (self.parent.equipment.ranged is not None and self.parent.equipment.ranged.equippable.status_effect == "bleed") or (self.parent.equipment.accessory_1 is not None and self.parent.equipment.accessory_1.equippable.status_effect == "bleed")):
-                if not target.status.dict_condition_afflicted["bleed"]:
+            equipment_effects = 0
+            for item in (self.parent.equipment.meelee, self.parent.equipment.ranged, self.parent.equipment.accessory_1):
+                if item is not None and item.equippable.status_effect:
+                    equipment_effects |= Condition[item.equippable.status_effect.upper()]
+            if equipment_effects & Condition.BLEED:
+                if not target.status.afflicted & Condition.BLEED:
                     if not target.status.check_bleed_immunity:
-                        target.status.dict_condition_afflicted["bleed"] = True
+                        target.status.afflict(Condition.BLEED)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is bleeding!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is resistant to bleeding!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already bleeding!", attack_color)
-            if ((self.parent.equipment.meelee is not None and self.parent.equipment.meelee.equippable.status_effect == "poison") or (self.parent.equipment.ranged is not None and self.parent.equipment.ranged.equippable.status_effect == "poison") or (self.parent.equipment.accessory_1 is not None and self.entity.equipment.accessory_1.equippable.status_effect == "poison")):
-                if not target.status.dict_condition_afflicted["poison"]:
+            if equipment_effects & Condition.POISON:
+                if not target.status.afflicted & Condition.POISON:
                     if not target.status.check_poison_immunity:
-                        target.status.dict_condition_afflicted["poison"] = True
+                        target.status.afflict(Condition.POISON)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is poisoned!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is resistant to poison!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already poisoned!", attack_color)
-            if ((self.parent.equipment.meelee is not None and self.parent.equipment.meelee.equippable.status_effect == "stun") or (self.parent.equipment.ranged is not None and self.parent.equipment.ranged.equippable.status_effect == "stun") or (self.parent.equipment.accessory_1 is not None and self.entity.equipment.accessory_1.equippable.status_effect == "stun")):
-                if not target.status.dict_condition_afflicted["stun"]:
+            if equipment_effects & Condition.STUN:
+                if not target.status.afflicted & Condition.STUN:
                     if not target.status.check_stun_immunity:
-                        target.status.dict_condition_afflicted["stun"] = True
-                        target.status.dict_turns_passed["stun"] = 0
+                        target.status.afflict(Condition.STUN)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is stunned!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is resistant to stun!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already stunned!", attack_color)
-            if ((self.parent.equipment.meelee is not None and self.parent.equipment.meelee.equippable.status_effect == "confusion") or (self.parent.equipment.ranged is not None and self.parent.equipment.ranged.equippable.status_effect == "confusion") or (self.parent.equipment.accessory_1 is not None and self.entity.equipment.accessory_1.equippable.status_effect == "confusion")):
-                if not target.status.dict_condition_afflicted["confusion"]:
+            if equipment_effects & Condition.CONFUSION:
+                if not target.status.afflicted & Condition.CONFUSION:
                     if not target.status.check_confusion_immunity:
-                        target.status.dict_condition_afflicted["confusion"] = True
-                        target.status.dict_turns_passed["confusion"] = 0
+                        target.status.afflict(Condition.CONFUSION)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is confused!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is resistant to confusion!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already confusion!", attack_color)
-            if ((self.parent.equipment.meelee is not None and self.parent.equipment.meelee.equippable.status_effect == "grab") or (self.parent.equipment.ranged is not None and self.parent.equipment.ranged.equippable.status_effect == "grab") or (self.parent.equipment.accessory_1 is not None and self.entity.equipment.accessory_1.equippable.status_effect == "grab")):
+            if equipment_effects & Condition.GRAB:
                 if not target.status.check_grabbed_condition:
                     if not target.status.check_grab_immunity:
-                        target.status.dict_condition_afflicted["grab"] = True
-                        target.status.dict_turns_passed["grab"] = 0
+                        target.status.afflict(Condition.GRAB)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is grabbed by the {self.parent.name}!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is too agile to be grabbed!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already grabbed by the {self.parent.name}!", attack_color)
-            if ((self.parent.equipment.meelee is not None and self.parent.equipment.meelee.equippable.status_effect == "fear") or (self.parent.equipment.ranged is not None and self.parent.equipment.ranged.equippable.status_effect == "fear") or (self.parent.equipment.accessory_1 is not None and self.entity.equipment.accessory_1.equippable.status_effect == "fear")):
-                if not target.status.dict_condition_afflicted["fear"]:
+            if equipment_effects & Condition.FEAR:
+                if not target.status.afflicted & Condition.FEAR:
                     if not target.status.check_fear_immunity:
-                        target.status.dict_condition_afflicted["fear"] = True
-                        target.status.dict_turns_passed["fear"] = 0
+                        target.status.afflict(Condition.FEAR)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is afraid of his enemy!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is too strong willed to be afraid!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already afraid of his enemy!", attack_color)
-            if ((self.parent.equipment.meelee is not None and self.parent.equipment.meelee.equippable.status_effect == "charm") or (self.parent.equipment.ranged is not None and self.parent.equipment.ranged.equippable.status_effect == "charm") or (self.parent.equipment.accessory_1 is not None and self.entity.equipment.accessory_1.equippable.status_effect == "charm")):
-                if not target.status.dict_condition_afflicted["charm"]:
+            if equipment_effects & Condition.CHARM:
+                if not target.status.afflicted & Condition.CHARM:
                     if not target.status.check_charm_immunity:
-                        target.status.dict_condition_afflicted["charm"] = True
-                        target.status.dict_turns_passed["charm"] = 0
+                        target.status.afflict(Condition.CHARM)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is charmed by his enemy!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is too strong willed to be charmed!", attack_color)
                 else:
                     self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is already charmed of his enemy!", attack_color)
-            if ((self.parent.equipment.meelee is not None and self.parent.equipment.meelee.equippable.status_effect == "rage") or (self.parent.equipment.ranged is not None and self.parent.equipment.ranged.equippable.status_effect == "rage") or (self.parent.equipment.accessory_1 is not None and self.entity.equipment.accessory_1.equippable.status_effect == "rage")):
-                if not target.status.dict_condition_afflicted["rage"]:
+            if equipment_effects & Condition.RAGE:
+                if not target.status.afflicted & Condition.RAGE:
                     if not target.status.check_rage_immunity:
-                        target.status.dict_condition_afflicted["rage"] = True
-                        target.status.dict_turns_passed["rage"] = 0
+                        target.status.afflict(Condition.RAGE)
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is enraged!", attack_color)
                     else:
                         self.parent.gamemap.engine.message_log.add_message(f"The {target.name} is too strong willed to be enraged!", attack_color)
@@ -342,45 +468,45 @@ class Status(BaseComponent):
         # Check for the bleed turns
         if actor.status.check_turns_bleed:
             actor.status.effect_hp_damage()
-            actor.status.dict_turns_passed["bleed"] = 0
-        elif actor.status.dict_condition_afflicted["bleed"]:
-            actor.status.dict_turns_passed["bleed"] += 1
+            actor.status.reset_turns(Condition.BLEED)
+        elif actor.status.afflicted & Condition.BLEED:
+            actor.status.tick(Condition.BLEED)
         
         # Check for the poison turns
         if actor.status.check_turns_poison:
             actor.status.effect_hp_damage()
-            actor.status.dict_turns_passed["poison"] = 0
-        elif actor.status.dict_condition_afflicted["bleed"]:
-            actor.status.dict_turns_passed["poison"] += 1
+            actor.status.reset_turns(Condition.POISON)
+        elif actor.status.afflicted & Condition.POISON:
+            actor.status.tick(Condition.POISON)
 
         # Check if the player is afflicted by condemnation
-        if actor.status.dict_condition_afflicted["condemnation"]:
+        if actor.status.afflicted & Condition.CONDEMNATION:
 
             # If the number of turns is over the number of turns required for the condemnation, if is the player, the game is over
             if actor.status.check_turns_condemnation:
                 if actor == engine.player:
                     self.engine.message_log.add_message(f"The weight of your condemnation reaches you!")
                 else:
-                    self.engine.message_log.add_message(f"The weight of your condemnation reaches the {self.entity.name}!")
+                    self.engine.message_log.add_message(f"The weight of your condemnation reaches the {self.parent.name}!")
                 actor.fighter.hp = 0
             # Else, it adds a turns for the condemnation
             else:
-                actor.status.dict_turns_passed["condemnation"] += 1
+                actor.status.tick(Condition.CONDEMNATION)
                 self.engine.message_log.add_message(f"Death is soon approaching!")
                 
         # Check if the player is afflicted by petrification
-        if actor.status.dict_condition_afflicted["petrification"]:
+        if actor.status.afflicted & Condition.PETRIFICATION:
 
             # If the number of turns is over the number of turns required for the petrification, if is the player, the game is over
             if actor.status.check_turns_petrification:
                 if actor == engine.player:
                     self.engine.message_log.add_message(f"All your body is now turned to stone!")
                 else:
-                    self.engine.message_log.add_message(f"All of {self.entity.name} body is now turned to stone!")
+                    self.engine.message_log.add_message(f"All of {self.parent.name} body is now turned to stone!")
                 actor.fighter.hp = 0
             # Else, it adds a turns for the petrification
             else:
-                actor.status.dict_turns_passed["petrification"] += 1
+                actor.status.tick(Condition.PETRIFICATION)
                 self.engine.message_log.add_message(f"More of your body is turning to stone!")
         
 
@@ -402,3 +528,11 @@ def confusion_direction() -> Tuple[int, int]:
 
     return direction_x, direction_y
 
+
+# Conditions flood the message log, their checks get their own spans.
+tracing.instrument(
+    Status,
+    "affect_new_status",
+    "status",
+    lambda status, action, target, attack_color: {"actor": status.parent.name, "target": target.name},
+)
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Optional, Tuple, Type, TypeVar, Union
-import copy
 import math
 
+from components import species as species_registry
+from game_logic.turn_scheduler import NORMAL_SPEED
 from render_logic.render_order import RenderOrder
+from utility_files.utility import shallow_clone
 
 if TYPE_CHECKING:
     from components.ai import BaseAI
@@ -16,8 +18,10 @@ if TYPE_CHECKING:
     from components.inventory import Inventory
     from components.level import Level
     from components.special_attacks import SpecialAttacks
+    from components.species import Species
     from components.status import Status
     from game_map import GameMap
+    from game_map.actor_store import ActorStore
 
 T = TypeVar("T", bound="Entity")
 
@@ -27,6 +31,9 @@ class Entity:
     A generic object to represent players, enemies, items, etc.
     """
 
+    # Slotted, like the components, so the many entities of a floor don't each carry a __dict__.
+    __slots__ = ("parent", "x", "y", "char", "color", "name", "blocks_movement", "render_order")
+
     parent: Union[GameMap, Inventory]
 
     def __init__(
@@ -50,31 +57,44 @@ class Entity:
         if parent:
             # If parent isn't provided now then it will be set later.
             self.parent = parent
-            parent.entities.add(self)
+            parent.add_entity(self)
 
     @property
     def gamemap(self) -> GameMap:
         return self.parent.gamemap
 
+    def clone(self: T) -> T:
+        """Return a copy of this entity, without a parent.
+
+        Much cheaper than copy.deepcopy, only the components and the mutable state are copied, the rest is shared
+        with the original.
+        """
+        return shallow_clone(self)
+
     def spawn(self: T, gamemap: GameMap, x: int, y: int) -> T:
         """Spawn a copy of this instance at the given location."""
-        clone = copy.deepcopy(self)
+        clone = self.clone()
         clone.x = x
         clone.y = y
         clone.parent = gamemap
-        gamemap.entities.add(clone)
+        gamemap.add_entity(clone)
         return clone
 
     def place(self, x: int, y: int, gamemap: Optional[GameMap] = None) -> None:
         """Place this entitiy at a new location.  Handles moving across GameMaps."""
-        self.x = x
-        self.y = y
         if gamemap:
             if hasattr(self, "parent"):  # Possibly uninitialized.
                 if self.parent is self.gamemap:
-                    self.gamemap.entities.remove(self)
+                    self.gamemap.remove_entity(self)
+            self.x = x
+            self.y = y
             self.parent = gamemap
-            gamemap.entities.add(self)
+            gamemap.add_entity(self)
+        elif hasattr(self, "parent") and self.parent is self.gamemap:
+            self.gamemap.move_entity(self, x, y)
+        else:
+            self.x = x
+            self.y = y
 
     def distance(self, x: int, y: int) -> float:
         """
@@ -84,11 +104,24 @@ class Entity:
 
     def move(self, dx: int, dy: int) -> None:
         # Move the entity by a given amount
-        self.x += dx
-        self.y += dy
+        self.gamemap.move_entity(self, self.x + dx, self.y + dy)
 
 
 class Actor(Entity):
+    __slots__ = (
+        "ai",
+        "equipment",
+        "fighter",
+        "inventory",
+        "level",
+        "status",
+        "damage_info",
+        "special_attacks",
+        "speed",
+        "store",
+        "store_row",
+    )
+
     def __init__(
         self,
         *,
@@ -105,6 +138,8 @@ class Actor(Entity):
         status: Status,
         damage_info: DamageInfo,
         special_attacks: SpecialAttacks,
+        speed: int = NORMAL_SPEED,
+        species: Optional[str] = None,
     ):
         super().__init__(
             x=x,
@@ -116,6 +151,10 @@ class Actor(Entity):
             render_order=RenderOrder.ACTOR,
         )
 
+        # Actor store of the map this actor is on and its row there, set by ActorStore.attach.
+        self.store: Optional[ActorStore] = None
+        self.store_row = -1
+
         self.ai: Optional[BaseAI] = ai_cls(self)
 
         self.equipment: Equipment = equipment
@@ -139,6 +178,31 @@ class Actor(Entity):
         self.special_attacks = special_attacks
         self.special_attacks.parent = self
 
+        # The data that never changes is shared by every actor of the species, the name of the actor by default.
+        shared = species_registry.define(species or name, status.species, damage_info.species, special_attacks.species)
+        status.species = damage_info.species = special_attacks.species = shared
+
+        # How often the actor acts, 100 is once per player turn, see TurnScheduler.
+        self.speed = speed
+
+    def clone(self) -> Actor:
+        clone = super().clone()
+        clone.store = None
+        clone.store_row = -1
+        clone.ai = type(self.ai)(clone) if self.ai else None
+        clone.fighter = self.fighter.clone(clone)
+        clone.inventory = self.inventory.clone(clone)
+        clone.equipment = self.equipment.clone(clone)  # After the inventory, it equips items from there.
+        clone.level = self.level.clone(clone)
+        clone.status = self.status.clone(clone)
+        clone.damage_info = self.damage_info.clone(clone)
+        clone.special_attacks = self.special_attacks.clone(clone)
+        return clone
+
+    @property
+    def species(self) -> Species:
+        return self.status.species
+
     @property
     def is_alive(self) -> bool:
         """Returns True as long as this actor can perform actions."""
@@ -146,6 +210,8 @@ class Actor(Entity):
 
 
 class Item(Entity):
+    __slots__ = ("material", "magic_item", "damaged", "consumable", "equippable")
+
     def __init__(
         self,
         *,
@@ -184,6 +250,14 @@ class Item(Entity):
         if self.equippable:
             self.equippable.parent = self
     
+    def clone(self) -> Item:
+        clone = super().clone()
+        if self.consumable:
+            clone.consumable = self.consumable.clone(clone)
+        if self.equippable:
+            clone.equippable = self.equippable.clone(clone)
+        return clone
+
     @property
     def is_organic(self) -> bool:
         return self.material == "paper" or self.material == "leather" or self.material == "wood"
@@ -194,6 +268,8 @@ class Item(Entity):
 
 
 class Chest(Entity):
+    __slots__ = ("item", "opened", "locked")
+
     def __init__(
             self,
             *,
@@ -211,14 +287,20 @@ class Chest(Entity):
         self.opened = False
         self.locked = locked
 
+    def clone(self) -> Chest:
+        clone = super().clone()
+        if self.item:
+            clone.item = self.item.clone()
+        return clone
+
     def spawn(self: T, gamemap: GameMap, x: int, y: int, item: Item) -> T:
         """Spawn a copy of this chest at the given location."""
-        clone = copy.deepcopy(self)
+        clone = self.clone()
         clone.x = x
         clone.y = y
         clone.item = item
         clone.parent = gamemap
-        gamemap.chests.add(clone)
+        gamemap.add_chest(clone)
         return clone
 
 
@@ -1,4 +1,5 @@
 from components import consumable
+from entity import prototypes
 from entity.entity import Item
 
 #This sections contains the scrolls
@@ -12,3 +13,6 @@ stun_scroll = Item(char="~", color=(255, 255, 0), name="Stun Scroll", material="
 #This sections contains the potions
 health_potion = Item(char="!", color=(127, 0, 255), name="Health Potion", material="liquid", magic_item=True, consumable=consumable.HealingConsumable(amount=4),)
 status_potion = Item(char="!", color=(127, 0, 255), name="Status Potion", material="liquid", magic_item=True, consumable=consumable.HealingStatusConsumable(amount=2),)
+
+
+prototypes.register_module(globals())
@@ -6,6 +6,7 @@ from components.inventory import Inventory
 from components.level import Level
 from components.special_attacks import SpecialAttacks
 from components.status import Status
+from entity import prototypes
 from entity.entity import Actor, Chest
 
 player = Actor(
@@ -75,4 +76,7 @@ magic_orc = Actor(char="m", color=(63,127, 63), name="Magic Ord",
 
 
 #This sections contains the neutral entities
-chest = Chest(char="(", color=(139, 69, 19), name="Chest")
\ No newline at end of file
+chest = Chest(char="(", color=(139, 69, 19), name="Chest")
+
+
+prototypes.register_module(globals())
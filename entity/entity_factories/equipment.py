@@ -1,4 +1,5 @@
 from components import equippable
+from entity import prototypes
 from entity.entity import Item
 
 
@@ -19,3 +20,6 @@ chain_mail = Item(char="[", color=(139, 69, 19), name="Chain Mail", material="me
 #This sections contains the accessories
 attack_ring = Item(char="[", color=(0, 191, 255), name="Power Ring", material="metal", magic_item=True, equippable=equippable.AttackRing())
 defense_ring = Item(char="[", color=(139, 69, 19), name="Armor Ring", material="metal", magic_item=True, equippable=equippable.DefenseRing())
+
+
+prototypes.register_module(globals())
@@ -0,0 +1,34 @@
+"""Registry of the entity prototypes, by kind.
+
+The prototypes are the templates of entity_factories, they're never placed on a map themselves, every instance
+is built from one with Entity.clone, which knows the layout of the components and copies only what can change.
+"""
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping
+
+from entity.entity import Entity
+
+_prototypes: Dict[str, Entity] = {}
+
+
+def register(kind: str, prototype: Entity) -> None:
+    if kind in _prototypes:
+        raise ValueError(f"A prototype of kind {kind!r} is already registered.")
+    _prototypes[kind] = prototype
+
+
+def register_module(namespace: Mapping[str, Any]) -> None:
+    """Register every entity of a module namespace, by variable name."""
+    for kind, value in list(namespace.items()):
+        if isinstance(value, Entity):
+            register(kind, value)
+
+
+def get(kind: str) -> Entity:
+    return _prototypes[kind]
+
+
+def build(kind: str) -> Entity:
+    """Return a new instance of a kind, without a parent."""
+    return _prototypes[kind].clone()
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from enum import Enum, auto
+from typing import TYPE_CHECKING, Dict
+
+from actions_logic.actions import MovementAction
+from components.condition_types import Condition
+import utility_files.exceptions as exceptions
+
+if TYPE_CHECKING:
+    from entity.entity import Actor
+    from game_logic.engine import Engine
+
+
+# Conditions whose timers the AI and BumpAction advance, drifting actors tick them without acting on them.
+# Once expired, the next full turn of the actor cures them.
+DRIFT_TICKED = (Condition.CHARM, Condition.RAGE, Condition.CONFUSION, Condition.STUN)
+
+
+class ActivationTier(Enum):
+    AWAKE = auto()  # Runs its full AI every turn.
+    DRIFTING = auto()  # Steps toward the last known position of the player every few turns.
+    DORMANT = auto()  # Out of the turn scheduler until something wakes it up.
+
+
+class ActorActivation:
+    """Decides how much work each actor gets to do, depending on its distance from the player.
+
+    Actors within `wake_radius` of the player run their full AI. Actors within `drift_radius`, or that heard a
+    noise, drift toward where they last saw or heard the player once every `drift_interval` turns. Every other
+    actor sleeps out of the turn scheduler, and is woken up once the player comes within `drift_radius` or makes
+    a noise it can hear.
+
+    Drifting actors only count down the timers of DRIFT_TICKED, without taking damage or logging anything.
+    Bleeding, poison, condemnation and petrification advance when the actor acts, like for awake actors.
+    Sleeping actors get no turns at all, their condition timers freeze until they wake up.
+    """
+
+    def __init__(
+        self,
+        wake_radius: int = 16,
+        drift_radius: int = 32,
+        drift_interval: int = 3,
+        noise_radius: int = 10,
+    ):
+        self.wake_radius = wake_radius
+        self.drift_radius = drift_radius
+        self.drift_interval = drift_interval
+        self.noise_radius = noise_radius
+
+        # Number of actor turns spent in each tier, DORMANT counts the actors put to sleep.
+        self.counters: Dict[ActivationTier, int] = {tier: 0 for tier in ActivationTier}
+
+    def wake_nearby(self, engine: Engine) -> None:
+        """Put back in the scheduler the sleeping actors the player came close to."""
+        game_map = engine.game_map
+        player = engine.player
+        for actor in game_map.get_actors_in_radius(player.x, player.y, self.drift_radius):
+            if actor is not player:
+                game_map.scheduler.wake(game_map.get_entity_id(actor))
+
+    def make_noise(self, engine: Engine, x: int, y: int, radius: int) -> None:
+        """Wake up the actors within `radius` of (x, y), they will drift toward it."""
+        game_map = engine.game_map
+        for actor in game_map.get_actors_in_radius(x, y, radius):
+            if actor is not engine.player and actor.ai:
+                actor.ai.last_known_position = (x, y)
+                game_map.scheduler.wake(game_map.get_entity_id(actor))
+
+    def tier_of(self, engine: Engine, actor: Actor) -> ActivationTier:
+        distance = (actor.x - engine.player.x) ** 2 + (actor.y - engine.player.y) ** 2
+        if distance <= self.wake_radius ** 2:
+            return ActivationTier.AWAKE
+        if distance <= self.drift_radius ** 2 or actor.ai.last_known_position is not None:
+            return ActivationTier.DRIFTING
+        return ActivationTier.DORMANT
+
+    def perform(self, engine: Engine, actor: Actor) -> None:
+        """Run the turn of a scheduled actor, with the amount of work its tier allows."""
+        tier = self.tier_of(engine, actor)
+        self.counters[tier] += 1
+
+        if tier is ActivationTier.AWAKE:
+            if engine.game_map.visible[actor.x, actor.y]:
+                actor.ai.last_known_position = (engine.player.x, engine.player.y)
+            actor.ai.perform()
+        elif tier is ActivationTier.DRIFTING:
+            self.tick_conditions(actor)
+            actor.ai.turns_since_drift += 1
+            if actor.ai.turns_since_drift >= self.drift_interval:
+                actor.ai.turns_since_drift = 0
+                self.drift(actor)
+        else:
+            engine.game_map.scheduler.sleep(engine.game_map.get_entity_id(actor))
+
+    def tick_conditions(self, actor: Actor) -> None:
+        """Count down the DRIFT_TICKED timers of an actor that doesn't run its AI this turn."""
+        status = actor.status
+        for condition in DRIFT_TICKED:
+            if status.afflicted & condition:
+                status.tick(condition)
+
+    def drift(self, actor: Actor) -> None:
+        """Take one step toward the last known position of the player, without pathfinding."""
+        if actor.ai.last_known_position is None:
+            return
+
+        target_x, target_y = actor.ai.last_known_position
+        dx = (target_x > actor.x) - (target_x < actor.x)
+        dy = (target_y > actor.y) - (target_y < actor.y)
+        if max(abs(target_x - actor.x), abs(target_y - actor.y)) <= 1:
+            actor.ai.last_known_position = None  # Nothing to find here.
+            return
+
+        for step_x, step_y in ((dx, dy), (dx, 0), (0, dy)):
+            if step_x or step_y:
+                try:
+                    return MovementAction(actor, step_x, step_y).perform()
+                except exceptions.Impossible:
+                    pass
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Dict, Optional, Set, Tuple
 import lzma
 import pickle
 
 from tcod.console import Console
-from tcod.map import compute_fov
+import numpy as np
+import tcod
 
 from render_logic.message_log import MessageLog
+from game_logic.activation import ActorActivation
+from game_logic.turn_scheduler import ACTION_TIME
 import utility_files.exceptions as exceptions
+import utility_files.tracing as tracing
 import render_logic.render_functions as render_functions
 
 if TYPE_CHECKING:
@@ -24,24 +28,65 @@ class Engine:
         self.message_log = MessageLog()
         self.mouse_location = (0, 0)
         self.player = player
+        # Distance maps computed during the current enemy turn, keyed by their root.
+        self.distance_maps: Dict[Tuple[int, int], np.ndarray] = {}
+        self.activation = ActorActivation()
+        # Rows of the actors in view after the last update_fov, and whether one came into view since the last
+        # call to take_input_interrupt.
+        self.visible_actor_rows: Tuple[Optional[GameMap], Set[int]] = (None, set())
+        self.actor_came_into_view = False
 
     def handle_enemy_turns(self) -> None:
-        for entity in set(self.game_map.actors) - {self.player}:
-            if entity.ai:
-                try:
-                    entity.ai.perform()
-                except exceptions.Impossible:
-                    pass  # Ignore impossible action exceptions from AI.
+        with tracing.span("handle_enemy_turns"):
+            self.activation.wake_nearby(self)
+            try:
+                # The player's action took a turn, every actor due in the meantime gets to act.
+                for entity in self.game_map.scheduler.advance(ACTION_TIME):
+                    if entity.ai:
+                        try:
+                            self.activation.perform(self, entity)
+                        except exceptions.Impossible:
+                            pass  # Ignore impossible action exceptions from AI.
+            finally:
+                self.distance_maps.clear()
+
+    def make_noise(self, x: int, y: int) -> None:
+        """Let the actors sleeping within earshot of (x, y) know something happened there."""
+        self.activation.make_noise(self, x, y, self.activation.noise_radius)
+
+    def get_distance_map(self, x: int, y: int) -> np.ndarray:
+        """Return the Dijkstra distance of every tile from (x, y).
+
+        The map is computed once per enemy turn and shared by every actor chasing the same target,
+        unreachable tiles keep the maximum value of the array.
+        """
+        distance = self.distance_maps.get((x, y))
+        if distance is None:
+            distance = tcod.path.maxarray((self.game_map.width, self.game_map.height), order="F")
+            distance[x, y] = 0
+            tcod.path.dijkstra2d(distance, self.game_map.path_cost(), 2, 3, out=distance)
+            self.distance_maps[x, y] = distance
+        return distance
 
     def update_fov(self, radius) -> None:
-        """Recompute the visible area based on the players point of view."""
-        self.game_map.visible[:] = compute_fov(
-            self.game_map.tiles["transparent"],
-            (self.player.x, self.player.y),
-            radius=radius,
-        )
-        # If a tile is "visible" it should be added to "explored".
-        self.game_map.explored |= self.game_map.visible
+        """Update the visible area based on the players point of view, if the player or the map changed."""
+        game_map = self.game_map
+        with tracing.span("update_fov", radius=radius):
+            game_map.update_visible(self.player.x, self.player.y, radius)
+
+        # Monsters walk into view without the field of view changing, so this is checked after every turn.
+        rows = set(game_map.actor_store.rows_visible(game_map.visible).tolist())
+        rows.discard(self.player.store_row)
+        seen_map, seen_rows = self.visible_actor_rows
+        if seen_map is game_map and not rows <= seen_rows:
+            self.actor_came_into_view = True
+        self.visible_actor_rows = (game_map, rows)
+
+    def take_input_interrupt(self) -> bool:
+        """Return True, once, if a monster came into view or a warning was logged, a held key should stop."""
+        interrupted = self.actor_came_into_view or self.message_log.warning_logged
+        self.actor_came_into_view = self.message_log.warning_logged = False
+        return interrupted
 
     def render(self, console: Console) -> None:
         self.game_map.render(console)
@@ -65,6 +110,7 @@ class Engine:
 
     def save_as(self, filename: str) -> None:
         """Save this Engine instance as a compressed file."""
-        save_data = lzma.compress(pickle.dumps(self))
-        with open(filename, "wb") as f:
-            f.write(save_data)
+        with tracing.span("save_as", filename=filename):
+            save_data = lzma.compress(pickle.dumps(self))
+            with open(filename, "wb") as f:
+                f.write(save_data)
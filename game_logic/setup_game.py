@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from typing import Optional
-import copy
+import functools
 import lzma
 import pickle
 import traceback
@@ -14,6 +14,7 @@ import libtcodpy
 from game_logic.engine import Engine
 from game_map.game_map import GameWorld
 import game_map.color as color
+from entity import prototypes
 from entity.entity_factories import entities
 from entity.entity_factories import equipment
 from entity.entity_factories import consumable
@@ -33,7 +34,7 @@ def new_game() -> Engine:
     room_min_size = 6
     max_rooms = 30
 
-    player = copy.deepcopy(entities.player)
+    player = prototypes.build("player")
 
     engine = Engine(player=player)
 
@@ -51,9 +52,9 @@ def new_game() -> Engine:
 
     engine.message_log.add_message("Welcome to the dungeon, adventurer!", color.welcome_text)
 
-    dagger = copy.deepcopy(equipment.dagger)
-    leather_armor = copy.deepcopy(equipment.leather_armor)
-    bow = copy.deepcopy(equipment.bow)
+    dagger = prototypes.build("dagger")
+    leather_armor = prototypes.build("leather_armor")
+    bow = prototypes.build("bow")
 
     dagger.parent = player.inventory
     leather_armor.parent = player.inventory
@@ -80,13 +81,31 @@ def load_game(filename: str) -> Engine:
     return engine
 
 
+@functools.lru_cache(maxsize=None)
+def background_layer(width: int, height: int) -> tcod.console.Console:
+    """Return the background image converted to glyphs once for a console size, it's slow to resample."""
+    layer = tcod.console.Console(width, height, order="F")
+    layer.draw_semigraphics(background_image, 0, 0)
+    return layer
+
+
 class MainMenu(input_handlers.BaseEventHandler):
     """Handle the main menu rendering and input."""
 
+    def __init__(self) -> None:
+        # The menu as last composed, it only changes with the size of the console.
+        self.menu_console: Optional[tcod.console.Console] = None
+
     def on_render(self, console: tcod.console.Console) -> None:
         """Render the main menu on a background image."""
-        console.draw_semigraphics(background_image, 0, 0)
-
+        menu = self.menu_console
+        if menu is None or (menu.width, menu.height) != (console.width, console.height):
+            menu = self.menu_console = tcod.console.Console(console.width, console.height, order="F")
+            background_layer(console.width, console.height).blit(menu)
+            self.compose(menu)
+        menu.blit(console)
+
+    def compose(self, console: tcod.console.Console) -> None:
         console.print(
             console.width // 2,
             console.height // 2 - 4,
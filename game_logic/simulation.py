@@ -0,0 +1,199 @@
+"""Run the game without a window, with a bot playing the player, and report how fast turns and floors go:
+
+    python -m game_logic.simulation --bot hunter --turns 2000 --floors 10
+
+This is the load test of the engine, ROGUELIKE_DEBUG=1 also runs the consistency checks after every turn.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Optional, Type
+import argparse
+import random
+import time
+
+import numpy as np
+import tcod
+
+from actions_logic.actions import Action, BumpAction, TakeStairsAction, WaitAction
+from components.condition_types import Condition
+import utility_files.exceptions as exceptions
+import utility_files.tracing as tracing
+from utility_files.utility import DEBUG
+
+if TYPE_CHECKING:
+    from game_logic.engine import Engine
+
+# Consecutive impossible actions after which the bot waits a turn instead, so a stuck bot can't hang the run.
+MAX_IMPOSSIBLE_ACTIONS = 20
+
+DIRECTIONS = [(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+
+
+class Bot:
+    """Plays the player of an engine, returning the action of each turn like the input handlers would."""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def next_action(self) -> Action:
+        raise NotImplementedError()
+
+
+class RandomBot(Bot):
+    """Bumps in a random direction, attacking whatever stands there."""
+
+    def next_action(self) -> Action:
+        return BumpAction(self.engine.player, *random.choice(DIRECTIONS))
+
+
+class HunterBot(Bot):
+    """Walks to the closest visible monster and fights it, or to the stairs and takes them."""
+
+    def next_action(self) -> Action:
+        engine = self.engine
+        player = engine.player
+        game_map = engine.game_map
+
+        target = game_map.get_nearest_actor(player.x, player.y, 20, exclude=player, visible_only=True)
+        if target is not None:
+            goal = (target.x, target.y)
+        elif (player.x, player.y) == game_map.downstairs_location:
+            return TakeStairsAction(player)
+        else:
+            goal = game_map.downstairs_location
+
+        # One step down the distance map toward the goal, the monster itself blocks so its tile counts as reached.
+        # Engine.get_distance_map caches its maps for the enemy turn, they'd be stale once the player moved.
+        distance = tcod.path.maxarray((game_map.width, game_map.height), order="F")
+        distance[goal] = 0
+        tcod.path.dijkstra2d(distance, game_map.path_cost(), 2, 3, out=distance)
+        best, best_distance = None, distance[player.x, player.y]
+        for dx, dy in DIRECTIONS:
+            x, y = player.x + dx, player.y + dy
+            if (x, y) == goal:
+                return BumpAction(player, dx, dy)
+            if game_map.in_bounds(x, y) and distance[x, y] < best_distance:
+                best, best_distance = (dx, dy), distance[x, y]
+        if best is None:
+            return WaitAction(player)
+        return BumpAction(player, *best)
+
+
+BOTS: Dict[str, Type[Bot]] = {"random": RandomBot, "hunter": HunterBot}
+
+
+def simulate(bot_cls: Type[Bot], turns: int, floors: int, seed: int) -> Dict[str, float]:
+    """Play `turns` turns, going down a floor every `turns // floors` turns if the bot didn't, and return the stats.
+
+    The player can't die, so every run plays the same number of turns. The floors forced by the run and the ones
+    the bot reached by taking the stairs are counted apart.
+    """
+    from game_logic.setup_game import new_game
+
+    random.seed(seed)
+    engine = new_game()
+    engine.player.fighter.max_hp = engine.player.fighter.hp = 10**9
+    bot = bot_cls(engine)
+
+    turns_per_floor = max(1, turns // max(1, floors))
+    timings = {"bot": 0.0, "action": 0.0, "ai": 0.0, "fov": 0.0, "floor": 0.0}
+    turn_times: List[float] = []
+    forced_floors = stairs_floors = impossible = consecutive_impossible = 0
+    floor_turns = 0
+    start = time.perf_counter()
+
+    while len(turn_times) < turns:
+        if floor_turns >= turns_per_floor:
+            floor_start = time.perf_counter()
+            engine.game_world.generate_floor()
+            engine.update_fov(radius=8)
+            timings["floor"] += time.perf_counter() - floor_start
+            forced_floors += 1
+            floor_turns = 0
+
+        turn_start = time.perf_counter()
+        game_map = engine.game_map
+        if consecutive_impossible < MAX_IMPOSSIBLE_ACTIONS:
+            action = bot.next_action()
+        else:
+            action = WaitAction(engine.player)
+        action_start = time.perf_counter()
+        timings["bot"] += action_start - turn_start
+        try:
+            action.perform()
+            consecutive_impossible = 0
+        except exceptions.Impossible:
+            impossible += 1
+            consecutive_impossible += 1
+            continue  # Like the input handlers, an impossible action doesn't take a turn.
+        finally:
+            action_end = time.perf_counter()
+            if engine.game_map is game_map:
+                timings["action"] += action_end - action_start
+            else:
+                timings["floor"] += action_end - action_start  # The bot took the stairs.
+                stairs_floors += 1
+                floor_turns = 0
+        engine.handle_enemy_turns()
+        ai_end = time.perf_counter()
+        engine.update_fov(radius=1 if engine.player.status.afflicted & Condition.BLINDNESS else 8)
+        turn_end = time.perf_counter()
+
+        timings["ai"] += ai_end - action_end
+        timings["fov"] += turn_end - ai_end
+        turn_times.append(turn_end - turn_start)
+        floor_turns += 1
+        if DEBUG:
+            engine.game_map.check_index()
+
+    elapsed = time.perf_counter() - start
+    p50, p95, p99 = np.percentile(turn_times, [50, 95, 99]) * 1000
+    floors_generated = forced_floors + stairs_floors
+    return {
+        "turns": len(turn_times),
+        "forced_floors": forced_floors,
+        "stairs_floors": stairs_floors,
+        "impossible_actions": impossible,
+        "seconds": elapsed,
+        "turns_per_second": len(turn_times) / elapsed,
+        "floors_per_second": floors_generated / timings["floor"] if timings["floor"] else 0.0,
+        "turn_ms_p50": p50,
+        "turn_ms_p95": p95,
+        "turn_ms_p99": p99,
+        **{f"{phase}_seconds": seconds for phase, seconds in timings.items()},
+    }
+
+
+def report(stats: Dict[str, float]) -> str:
+    phases = ", ".join(
+        f"{phase} {stats[f'{phase}_seconds'] / stats['seconds'] * 100:.0f}%"
+        for phase in ("bot", "action", "ai", "fov", "floor")
+    )
+    return (
+        f"{stats['turns']} turns in {stats['seconds']:.2f} s, {stats['forced_floors']} floors forced and "
+        f"{stats['stairs_floors']} reached by the stairs: "
+        f"{stats['turns_per_second']:.0f} turns/s, {stats['floors_per_second']:.1f} floors/s\n"
+        f"turn latency p50 {stats['turn_ms_p50']:.2f} ms, p95 {stats['turn_ms_p95']:.2f} ms, "
+        f"p99 {stats['turn_ms_p99']:.2f} ms\n"
+        f"time in {phases}"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bot", choices=sorted(BOTS), default="hunter")
+    parser.add_argument("--turns", type=int, default=2000)
+    parser.add_argument("--floors", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--trace", metavar="FILE", help="Save the last spans of the run as Chrome trace events.")
+    args = parser.parse_args(argv)
+
+    if args.trace:
+        tracing.enable()
+    print(report(simulate(BOTS[args.bot], args.turns, args.floors, args.seed)))
+    if args.trace:
+        print(f"Saved the last {tracing.dump(args.trace)} spans to {args.trace}.")
+
+
+if __name__ == "__main__":
+    main()
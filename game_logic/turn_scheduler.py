@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+import heapq
+
+if TYPE_CHECKING:
+    from entity.entity import Actor
+
+# Time taken by an action of an actor with normal speed, the player always takes this long.
+ACTION_TIME = 100
+NORMAL_SPEED = 100
+
+
+class TurnScheduler:
+    """Decides which actors act, and in which order, while time passes.
+
+    Actors are kept in a priority queue of (next action time, insertion number, actor id), the insertion number
+    keeps the order deterministic between actors acting at the same time.
+    Faster actors get to act more often, an actor with twice the normal speed acts twice per player turn.
+    """
+
+    def __init__(self) -> None:
+        self.time = 0
+        self._queue: List[Tuple[int, int, int]] = []
+        self._actors: Dict[int, Actor] = {}
+        self._live_entries: Dict[int, int] = {}  # Insertion number of the queued entry of each actor.
+        # Remainder of the division of each actor's last delay by its speed, carried to its next delay so that
+        # speeds that don't divide the action time evenly still get the right number of actions over time.
+        self._remainders: Dict[int, int] = {}
+        self._insertions = 0
+
+    def __len__(self) -> int:
+        return len(self._actors)
+
+    def __contains__(self, actor_id: int) -> bool:
+        return actor_id in self._actors
+
+    def is_sleeping(self, actor_id: int) -> bool:
+        return actor_id in self._actors and actor_id not in self._live_entries
+
+    def add(self, actor_id: int, actor: Actor) -> None:
+        """Schedule an actor, it will act the next time the clock moves."""
+        self._actors[actor_id] = actor
+        self._push(actor_id, self.time)
+
+    def remove(self, actor_id: int) -> None:
+        """Stop scheduling an actor.
+
+        The entry stays in the queue, it's skipped once it reaches the top.
+        """
+        self._actors.pop(actor_id, None)
+        self._live_entries.pop(actor_id, None)
+        self._remainders.pop(actor_id, None)
+
+    def sleep(self, actor_id: int) -> None:
+        """Take an actor out of the queue without forgetting it, until it's woken up."""
+        self._live_entries.pop(actor_id, None)
+
+    def wake(self, actor_id: int) -> None:
+        """Put a sleeping actor back in the queue, it will act the next time the clock moves."""
+        if self.is_sleeping(actor_id):
+            self._push(actor_id, self.time)
+
+    def advance(self, duration: int = ACTION_TIME) -> Iterator[Actor]:
+        """Move the clock forward, yielding every actor whose action comes due, in order.
+
+        An actor is rescheduled after the caller is done with it, unless it was removed or put to sleep in the
+        meantime.
+        """
+        end = self.time + duration
+        while self._queue and self._queue[0][0] < end:
+            action_time, insertion, actor_id = heapq.heappop(self._queue)
+            if self._live_entries.get(actor_id) != insertion:
+                continue  # Stale entry of a removed or sleeping actor.
+            actor = self._actors[actor_id]
+            self.time = action_time
+
+            yield actor
+
+            if self._live_entries.get(actor_id) == insertion:
+                self._push(actor_id, action_time + self._delay(actor_id, max(1, actor.speed)))
+        self.time = end
+
+    def _delay(self, actor_id: int, speed: int) -> int:
+        """Return the time until the next action of an actor, ACTION_TIME at normal speed."""
+        delay, self._remainders[actor_id] = divmod(
+            ACTION_TIME * NORMAL_SPEED + self._remainders.get(actor_id, 0), speed
+        )
+        return delay
+
+    def _push(self, actor_id: int, action_time: int) -> None:
+        self._live_entries[actor_id] = self._insertions
+        heapq.heappush(self._queue, (action_time, self._insertions, actor_id))
+        self._insertions += 1
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, List, Optional
+
+import numpy as np
+
+from components.damage_types import DamageType
+
+if TYPE_CHECKING:
+    from entity.entity import Actor
+
+
+class ActorStore:
+    """Struct-of-arrays copy of the state of the actors of a map, for bulk queries.
+
+    Each column is a NumPy array indexed by the id the map gave to the actor. The actors stay the authority,
+    their properties write through to the store whenever a stored value changes, so the columns are always up to
+    date and questions like "every living actor in this radius" become a couple of array operations.
+    """
+
+    # Name, dtype and shape of a row of each column.
+    COLUMNS = {
+        "x": (np.int32, ()),
+        "y": (np.int32, ()),
+        "hp": (np.float64, ()),  # Damage modificators can leave fractional hit points.
+        "max_hp": (np.int32, ()),
+        # Written when the fighter computes its derived stats again, so they lag behind Fighter.invalidate_stats.
+        "defense": (np.int32, ()),
+        "power": (np.int32, ()),
+        "alive": (np.bool_, ()),
+        "conditions": (np.uint16, ()),  # Mask of Condition, see Status.afflicted.
+        "damage_multipliers": (np.float64, (len(DamageType),)),  # See DamageInfo.multipliers.
+    }
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.actors: List[Optional[Actor]] = [None] * capacity
+        for name, (dtype, shape) in self.COLUMNS.items():
+            setattr(self, name, np.zeros((capacity, *shape), dtype=dtype))
+
+    def _grow(self, row: int) -> None:
+        capacity = self.capacity
+        while capacity <= row:
+            capacity *= 2
+        for name, (dtype, shape) in self.COLUMNS.items():
+            column = getattr(self, name)
+            grown = np.zeros((capacity, *shape), dtype=dtype)
+            grown[: self.capacity] = column
+            setattr(self, name, grown)
+        self.actors.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def attach(self, row: int, actor: Actor) -> None:
+        """Copy an actor into the given row, its properties will keep the row up to date."""
+        if row >= self.capacity:
+            self._grow(row)
+        self.actors[row] = actor
+        actor.store = self
+        actor.store_row = row
+        self.move(row, actor.x, actor.y)
+        self.alive[row] = actor.is_alive
+        actor.fighter.update_store()
+        self.conditions[row] = actor.status.afflicted
+        self.damage_multipliers[row] = actor.damage_info.multipliers
+
+    def detach(self, row: int) -> None:
+        actor = self.actors[row]
+        if actor is not None and actor.store is self:
+            actor.store = None
+            actor.store_row = -1
+        self.actors[row] = None
+        self.alive[row] = False
+
+    def move(self, row: int, x: int, y: int) -> None:
+        self.x[row] = x
+        self.y[row] = y
+
+    def rows_in_radius(self, x: int, y: int, radius: float) -> np.ndarray:
+        """Return the rows of the living actors within `radius` of (x, y)."""
+        distance = (self.x - x) ** 2 + (self.y - y) ** 2
+        return np.flatnonzero(self.alive & (distance <= radius * radius))
+
+    def rows_visible(self, visible: np.ndarray) -> np.ndarray:
+        """Return the rows of the living actors standing on a tile of the `visible` mask."""
+        return np.flatnonzero(self.alive & visible[self.x, self.y])
+
+    def rows_with_condition(self, conditions: int) -> np.ndarray:
+        """Return the rows of the living actors afflicted by any condition of the mask."""
+        return np.flatnonzero(self.alive & (self.conditions & conditions != 0))
+
+    def damage_taken(self, rows: np.ndarray, damage: int, damage_type: DamageType) -> List[float]:
+        """Return the damage each actor of `rows` takes from an attack, after its multiplier for the damage type.
+
+        Whole amounts are returned as ints, like DamageInfo.calculate_damage would give.
+        """
+        damages = (damage * self.damage_multipliers[rows, damage_type]).tolist()
+        return [int(amount) if amount.is_integer() else amount for amount in damages]
+
+    def get_actors(self, rows: np.ndarray) -> List[Actor]:
+        return [self.actors[row] for row in rows.tolist()]
+
+    def check(self) -> None:
+        """Check that every row matches its actor, this is only meant to be run when debugging."""
+        for row, actor in enumerate(self.actors):
+            if actor is None:
+                assert not self.alive[row], "A detached row is still alive."
+                continue
+            assert actor.store is self and actor.store_row == row, f"{actor.name} is attached to another row."
+            assert (self.x[row], self.y[row]) == (actor.x, actor.y), f"{actor.name} is stored at the wrong location."
+            assert self.alive[row] == actor.is_alive, f"{actor.name} has a stale alive flag."
+            fighter = actor.fighter
+            assert fighter.derived_stats == fighter.compute_stats(), f"{actor.name} has stale derived stats."
+            stored = (self.hp[row], self.max_hp[row], self.defense[row], self.power[row])
+            assert stored == (fighter.hp, fighter.max_hp, fighter.defense, fighter.power_meelee), (
+                f"{actor.name} has stale stats."
+            )
+            assert self.conditions[row] == actor.status.afflicted, f"{actor.name} has stale conditions."
+            assert tuple(self.damage_multipliers[row]) == actor.damage_info.multipliers, (
+                f"{actor.name} has stale damage multipliers."
+            )
@@ -22,5 +22,8 @@ bar_text = white
 bar_filled = (0x0, 0x60, 0x0)
 bar_empty = (0x40, 0x10, 0x10)
 
+# Messages in these colors stop a held movement key, see Engine.take_input_interrupt.
+warnings = {enemy_atk, player_die, error}
+
 menu_title = (255, 255, 63)
 menu_text = white
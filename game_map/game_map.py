@@ -1,28 +1,92 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from collections import OrderedDict
 
 from tcod.console import Console
+from tcod.map import compute_fov
 import numpy as np
+import math
 
 from entity.entity import Actor, Item, Chest
+from game_logic.turn_scheduler import TurnScheduler
+from game_map.actor_store import ActorStore
+from render_logic.render_order import RenderOrder
 import game_map.tile_types as tile_types
 
 if TYPE_CHECKING:
     from game_logic.engine import Engine
     from entity.entity import Entity
 
+# Extra pathfinding cost of a tile occupied by a blocking entity.
+BLOCKING_ENTITY_COST = 10
+
+# Side, in tiles, of the cells used to bucket living actors for the nearest actor queries.
+ACTOR_CELL_SIZE = 8
+
+# Number of fields of view memoized by each map, see update_visible.
+FOV_CACHE_SIZE = 16
+
 
 class GameMap:
+    # Number of update_visible calls that changed nothing, were answered from the memo, or computed the FOV.
+    fov_skips: int = 0
+    fov_cache_hits: int = 0
+    fov_computes: int = 0
+    # Number of map cells whose graphics render had to compose again.
+    layer_cells_rebuilt: int = 0
+
     def __init__(self, engine: Engine, width: int, height: int, entities: Iterable[Entity] = (), chests: Iterable[Entity] = ()):
         self.engine = engine
         self.width, self.height = width, height
-        self.entities = set(entities)
-        self.chests = set(chests)
+        # Dicts are used as insertion-ordered sets, so iterating them is deterministic.
+        self.entities: Dict[Entity, None] = {}
+        self.chests: Dict[Chest, None] = {}
+
+        # Typed buckets over self.entities, moved between on spawn, death, pickup and drop.
+        self._live_actors: Dict[Actor, None] = {}
+        self._corpses: Dict[Actor, None] = {}
+        self._items: Dict[Item, None] = {}
+        # Entities by render order, drawn in the order of RenderOrder, and the glyph arrays built from each bucket,
+        # None once the bucket or the location of one of its entities changed.
+        self._render_buckets: Dict[RenderOrder, Dict[Entity, None]] = {order: {} for order in RenderOrder}
+        self._glyphs: Dict[RenderOrder, Optional[Tuple[np.ndarray, ...]]] = {order: None for order in RenderOrder}
+
+        # Living actors other than the player, in the order they act.
+        self.scheduler = TurnScheduler()
+        # Array copy of the state of the actors, indexed by entity id, for bulk queries.
+        self.actor_store = ActorStore()
         self.tiles = np.full((width, height), fill_value=tile_types.wall, order="F")
 
+        # Location index, kept up to date by add_entity/remove_entity/move_entity.
+        # blocking_ids holds the id of the entity blocking each tile, or -1 if the tile is free.
+        self.blocking_ids = np.full((width, height), fill_value=-1, dtype=np.int32, order="F")
+        # Pathfinding cost, kept in sync with the tiles and blocking_ids, see set_tiles and path_cost.
+        self._path_cost = np.zeros((width, height), dtype=np.int8, order="F")
+        self.tiles_version = 0  # Incremented every time set_tiles changes the tiles.
+        self.transparency_version = 0  # Incremented every time set_tiles changes which tiles are transparent.
+        self._next_entity_id = 0
+        self._entity_ids: Dict[Entity, int] = {}
+        self._entities_by_id: Dict[int, Entity] = {}
+        self._indexed_locations: Dict[Entity, Tuple[int, int]] = {}
+        self._entities_at: Dict[Tuple[int, int], List[Entity]] = {}
+        self._chests_at: Dict[Tuple[int, int], Chest] = {}
+        self._actor_cells: Dict[Tuple[int, int], Dict[Actor, None]] = {}
+        self._actor_cell_of: Dict[Actor, Tuple[int, int]] = {}
+
+        for entity in entities:
+            self.add_entity(entity)
+        for chest in chests:
+            self.add_chest(chest)
+
         self.visible = np.full((width, height), fill_value=False, order="F")  # Tiles the player can currently see
         self.explored = np.full((width, height), fill_value=False, order="F")  # Tiles the player has seen before
+        # Fields of view by (x, y, radius, transparency_version), least recently used first, and the current one.
+        self._fov_cache: OrderedDict[Tuple[int, int, int, int], np.ndarray] = OrderedDict()
+        self._fov_key: Optional[Tuple[int, int, int, int]] = None
+        # Graphics of every cell as last rendered, and the cells whose tile, visible or explored state changed since.
+        self._layer = np.full((width, height), fill_value=tile_types.SHROUD, order="F")
+        self._dirty = np.full((width, height), fill_value=True, order="F")
 
         self.downstairs_location = (0, 0)
 
@@ -32,63 +96,360 @@ class GameMap:
 
     @property
     def actors(self) -> Iterator[Actor]:
-        """Iterate over this maps living actors."""
-        yield from (entity for entity in self.entities if isinstance(entity, Actor) and entity.is_alive)
+        """Iterate over this maps living actors, in the order they were added.
+
+        The bucket is copied first, so actors can die or spawn while iterating.
+        """
+        yield from list(self._live_actors)
+
+    @property
+    def corpses(self) -> Iterator[Actor]:
+        """Iterate over this maps dead actors."""
+        yield from list(self._corpses)
 
     @property
     def items(self) -> Iterator[Item]:
-        yield from (entity for entity in self.entities if isinstance(entity, Item))
+        yield from list(self._items)
+
+    def _bucket_for(self, entity: Entity) -> Optional[Dict]:
+        if isinstance(entity, Actor):
+            return self._live_actors if entity.is_alive else self._corpses
+        if isinstance(entity, Item):
+            return self._items
+        return None
+
+    def add_entity(self, entity: Entity) -> None:
+        """Add an entity to this map, indexing it at its current location."""
+        if entity in self._entity_ids:
+            self._unindex_entity(entity)
+        else:
+            self._entity_ids[entity] = self._next_entity_id
+            self._entities_by_id[self._next_entity_id] = entity
+            self._next_entity_id += 1
+            self.entities[entity] = None
+            self._render_buckets[entity.render_order][entity] = None
+            bucket = self._bucket_for(entity)
+            if bucket is not None:
+                bucket[entity] = None
+            if bucket is self._live_actors and entity is not self.engine.player:
+                self.scheduler.add(self._entity_ids[entity], entity)
+            if isinstance(entity, Actor):
+                self.actor_store.attach(self._entity_ids[entity], entity)
+        self._index_entity(entity)
+
+    def remove_entity(self, entity: Entity) -> None:
+        """Remove an entity from this map and from the location index."""
+        del self.entities[entity]
+        del self._render_buckets[entity.render_order][entity]
+        bucket = self._bucket_for(entity)
+        if bucket is not None:
+            del bucket[entity]
+        self._unindex_entity(entity)
+        self.scheduler.remove(self._entity_ids[entity])
+        if isinstance(entity, Actor):
+            self.actor_store.detach(self._entity_ids[entity])
+        del self._entities_by_id[self._entity_ids.pop(entity)]
+
+    def move_entity(self, entity: Entity, x: int, y: int) -> None:
+        """Set the location of an entity of this map, keeping the index up to date."""
+        self._unindex_entity(entity)
+        entity.x = x
+        entity.y = y
+        self._index_entity(entity)
+
+    def mark_dead(self, actor: Actor) -> None:
+        """Move a freshly killed actor to the corpses, which don't block movement."""
+        del self._live_actors[actor]
+        self._corpses[actor] = None
+        self.scheduler.remove(self._entity_ids[actor])
+        self._unindex_entity(actor)
+        self._index_entity(actor)
+
+    def set_render_order(self, entity: Entity, render_order: RenderOrder) -> None:
+        """Change the render order of an entity of this map, moving it to the matching render bucket."""
+        del self._render_buckets[entity.render_order][entity]
+        self._glyphs[entity.render_order] = None
+        entity.render_order = render_order
+        self._render_buckets[render_order][entity] = None
+        self._glyphs[render_order] = None
+
+    def add_chest(self, chest: Chest) -> None:
+        self.chests[chest] = None
+        self._chests_at[chest.x, chest.y] = chest
+
+    def _index_entity(self, entity: Entity) -> None:
+        location = (entity.x, entity.y)
+        self._glyphs[entity.render_order] = None
+        self._indexed_locations[entity] = location
+        self._entities_at.setdefault(location, []).append(entity)
+        if entity.blocks_movement and self.in_bounds(*location):
+            self.blocking_ids[location] = self._entity_ids[entity]
+            self._path_cost[location] = self._compute_path_cost(location)
+        if isinstance(entity, Actor):
+            self.actor_store.move(self._entity_ids[entity], entity.x, entity.y)
+            self.actor_store.alive[self._entity_ids[entity]] = entity.is_alive
+        if isinstance(entity, Actor) and entity.is_alive:
+            cell = (entity.x // ACTOR_CELL_SIZE, entity.y // ACTOR_CELL_SIZE)
+            self._actor_cell_of[entity] = cell
+            self._actor_cells.setdefault(cell, {})[entity] = None
+
+    def _unindex_entity(self, entity: Entity) -> None:
+        location = self._indexed_locations.pop(entity)
+        self._glyphs[entity.render_order] = None
+        entities_here = self._entities_at[location]
+        entities_here.remove(entity)
+        if not entities_here:
+            del self._entities_at[location]
+
+        cell = self._actor_cell_of.pop(entity, None)
+        if cell is not None:
+            actors_in_cell = self._actor_cells[cell]
+            del actors_in_cell[entity]
+            if not actors_in_cell:
+                del self._actor_cells[cell]
+
+        if self.in_bounds(*location) and self.blocking_ids[location] == self._entity_ids[entity]:
+            # Another blocking entity could share this tile, it takes over the slot.
+            self.blocking_ids[location] = next(
+                (self._entity_ids[other] for other in entities_here if other.blocks_movement), -1
+            )
+            self._path_cost[location] = self._compute_path_cost(location)
+
+    def check_index(self) -> None:
+        """Check that the location index matches the entities of this map.
+
+        This is expensive, it's only meant to be run when debugging.
+        """
+        expected_ids = np.full((self.width, self.height), fill_value=-1, dtype=np.int32, order="F")
+        for entity in self.entities:
+            location = (entity.x, entity.y)
+            assert self._indexed_locations.get(entity) == location, f"{entity.name} is indexed at the wrong location."
+            assert entity in self._entities_at[location], f"{entity.name} is missing from its tile."
+            assert self._entities_by_id[self._entity_ids[entity]] is entity, f"{entity.name} has a stale id."
+            if entity.blocks_movement and self.in_bounds(*location):
+                expected_ids[location] = self._entity_ids[entity]
+        assert len(self._indexed_locations) == len(self.entities), "The index contains removed entities."
+        assert sum(len(entities_here) for entities_here in self._entities_at.values()) == len(self.entities)
+        assert np.array_equal(expected_ids >= 0, self.blocking_ids >= 0), "The blocking grid is out of date."
+        assert np.array_equal(self._compute_path_cost(np.s_[:, :]), self._path_cost), "The path cost is out of date."
+        assert list(self._live_actors) == [e for e in self.entities if isinstance(e, Actor) and e.is_alive]
+        assert set(self._corpses) == {e for e in self.entities if isinstance(e, Actor) and not e.is_alive}
+        assert set(self._actor_cell_of) == set(self._live_actors), "The actor cells are out of date."
+        for actor, cell in self._actor_cell_of.items():
+            assert cell == (actor.x // ACTOR_CELL_SIZE, actor.y // ACTOR_CELL_SIZE) and actor in self._actor_cells[cell]
+        scheduled = [actor for actor in self._live_actors if actor is not self.engine.player]
+        assert len(self.scheduler) == len(scheduled), "The scheduler is out of date."
+        assert all(self._entity_ids[actor] in self.scheduler for actor in scheduled), "An actor is not scheduled."
+        assert list(self._items) == [e for e in self.entities if isinstance(e, Item)]
+        self.actor_store.check()
+        if self._fov_key is not None and self._fov_key[3] == self.transparency_version:
+            x, y, radius, _ = self._fov_key
+            fov = compute_fov(self.tiles["transparent"], (x, y), radius=radius)
+            assert np.array_equal(self._fov_cache[self._fov_key], fov), "The memoized FOV is out of date."
+        for render_order, bucket in self._render_buckets.items():
+            assert all(entity.render_order is render_order for entity in bucket), "An entity is in the wrong bucket."
+            glyphs = self._glyphs[render_order]
+            if glyphs is not None:
+                self._glyphs[render_order] = None
+                fresh = self._glyph_arrays(render_order)
+                assert all(np.array_equal(a, b) for a, b in zip(glyphs, fresh)), "The glyph arrays are out of date."
+        assert sum(len(bucket) for bucket in self._render_buckets.values()) == len(self.entities)
+        clean = ~self._dirty
+        assert np.array_equal(self._layer[clean], self._compose_layer(clean)), "The map layer is out of date."
+        for chest in self.chests:
+            assert self._chests_at.get((chest.x, chest.y)) is chest, f"{chest.name} is indexed at the wrong location."
+
+    def get_entities_at_location(self, x: int, y: int) -> List[Entity]:
+        """Return the entities standing on the given tile."""
+        return list(self._entities_at.get((x, y), ()))
+
+    def get_items_at_location(self, x: int, y: int) -> List[Item]:
+        return [entity for entity in self._entities_at.get((x, y), ()) if isinstance(entity, Item)]
 
     def get_blocking_entity_at_location(
         self,
         location_x: int,
         location_y: int,
     ) -> Optional[Entity]:
-        for entity in self.entities:
-            if entity.blocks_movement and entity.x == location_x and entity.y == location_y:
-                return entity
+        if not self.in_bounds(location_x, location_y):
+            return None
 
-        return None
+        entity_id = self.blocking_ids[location_x, location_y]
+        if entity_id < 0:
+            return None
+
+        return self._entities_by_id[entity_id]
 
     def get_actor_at_location(self, x: int, y: int) -> Optional[Actor]:
-        for actor in self.actors:
-            if actor.x == x and actor.y == y:
-                return actor
-        
+        for entity in self._entities_at.get((x, y), ()):
+            if isinstance(entity, Actor) and entity.is_alive:
+                return entity
+
         return None
     
+    def get_entity_id(self, entity: Entity) -> int:
+        """Return the id given to an entity when it was added to this map."""
+        return self._entity_ids[entity]
+
+    def get_actors_in_radius(self, x: int, y: int, radius: float) -> Iterator[Actor]:
+        """Iterate over the living actors within `radius` of (x, y), only looking at the cells around it."""
+        limit = radius * radius
+        reach = math.ceil(radius)
+        for cell_x in range(max(0, x - reach) // ACTOR_CELL_SIZE, min(self.width - 1, x + reach) // ACTOR_CELL_SIZE + 1):
+            for cell_y in range(
+                max(0, y - reach) // ACTOR_CELL_SIZE, min(self.height - 1, y + reach) // ACTOR_CELL_SIZE + 1
+            ):
+                for actor in list(self._actor_cells.get((cell_x, cell_y), ())):
+                    if (actor.x - x) ** 2 + (actor.y - y) ** 2 <= limit:
+                        yield actor
+
+    def get_actors_with_condition(self, conditions: int) -> List[Actor]:
+        """Return the living actors afflicted by any condition of the mask, like Condition.FEAR | Condition.BLINDNESS."""
+        return self.actor_store.get_actors(self.actor_store.rows_with_condition(conditions))
+
     def get_closest_actor(self, primary_actor: Actor, distance: int = 1, flag_player: bool = False) -> Optional[Actor]:
         """It checks for the closest actor that match the parameter.
         Flag_player is to include the player in the search of the closest actor."""
-        target = None
+        return self.get_nearest_actor(
+            primary_actor.x, primary_actor.y, distance, exclude=primary_actor, include_player=flag_player
+        )
 
-        for actor in self.actors:
-            #Check if the distance is minor than 8 and if the actor is not the primary actor
-            if actor.distance(primary_actor.x, primary_actor.y) <= distance and actor is not primary_actor:
-                if (flag_player):
-                    if target is None:
-                        target = actor
-                    elif actor.distance(primary_actor.x, primary_actor.y) < target.distance(primary_actor.x, primary_actor.y):
-                        target = actor
-                else:
-                    if target is None and actor is not self.engine.player:
-                        target = actor
-                    elif actor.distance(primary_actor.x, primary_actor.y) < target.distance(primary_actor.x, primary_actor.y) and actor is not self.engine.player:
+    def get_nearest_actor(
+        self,
+        x: int,
+        y: int,
+        radius: float,
+        *,
+        exclude: Optional[Entity] = None,
+        include_player: bool = True,
+        visible_only: bool = False,
+        direction: Optional[Tuple[int, int]] = None,
+        strict: bool = False,
+    ) -> Optional[Actor]:
+        """Return the living actor closest to (x, y) within `radius`, or None.
+
+        If `strict` is True, actors exactly `radius` away are out of reach.
+
+        `exclude` is never returned, usually it's the actor doing the search.
+        If `visible_only` is True, only actors on tiles the player can see are considered.
+        If `direction` is a cardinal (dx, dy), only actors on that side of the same row or column are considered.
+        """
+        def accepted(actor: Actor) -> bool:
+            if actor is exclude or (not include_player and actor is self.engine.player):
+                return False
+            return not visible_only or self.visible[actor.x, actor.y]
+
+        if direction is not None:
+            # Walk the row or the column outward, the first match is the closest one.
+            dx, dy = direction
+            for step in range(1, math.ceil(radius) if strict else int(radius) + 1):
+                actor = self.get_actor_at_location(x + dx * step, y + dy * step)
+                if actor and accepted(actor):
+                    return actor
+            return None
+
+        # Scan rings of cells around (x, y), until no cell left can hold anything closer.
+        limit = radius * radius
+        target = None
+        target_distance = math.inf
+        cell_x, cell_y = x // ACTOR_CELL_SIZE, y // ACTOR_CELL_SIZE
+        max_ring = min(
+            math.ceil(radius / ACTOR_CELL_SIZE) + 1,
+            max(self.width, self.height) // ACTOR_CELL_SIZE + 1,
+        )
+        for ring in range(max_ring + 1):
+            if ring >= 2 and ((ring - 1) * ACTOR_CELL_SIZE) ** 2 > min(limit, target_distance):
+                break
+            for cell in _ring_cells(cell_x, cell_y, ring):
+                for actor in self._actor_cells.get(cell, ()):
+                    distance = (actor.x - x) ** 2 + (actor.y - y) ** 2
+                    in_reach = distance < limit if strict else distance <= limit
+                    if in_reach and distance < target_distance and accepted(actor):
                         target = actor
+                        target_distance = distance
 
         return target
 
     def get_chest_at_location(self, x: int, y: int) -> Optional[Chest]:
-        for chest in self.chests:
-            if chest.x == x and chest.y == y:
-                return chest
+        return self._chests_at.get((x, y))
 
-        return None
+    def path_cost(self) -> np.ndarray:
+        """Return a read-only view of the pathfinding cost of each tile, 0 for walls.
+
+        Tiles with a blocking entity cost more, a lower number means enemies will crowd behind each other in
+        hallways, a higher number means enemies will take longer paths in order to surround the player.
+        """
+        view = self._path_cost.view()
+        view.flags.writeable = False
+        return view
+
+    def set_tiles(self, index: Union[Tuple[int, int], Tuple[slice, slice]], tile: np.ndarray) -> None:
+        """Change the tiles at the given location or area, keeping the path cost up to date."""
+        if np.any(self.tiles["transparent"][index] != tile["transparent"]):
+            self.transparency_version += 1
+        self.tiles[index] = tile
+        self._path_cost[index] = self._compute_path_cost(index)
+        self._dirty[index] = True
+        self.tiles_version += 1
+
+    def update_visible(self, x: int, y: int, radius: int) -> bool:
+        """Update the tiles the player sees from (x, y) and the explored tiles, return False if nothing changed.
+
+        The field of view only depends on the location, the radius and the transparent tiles, the last ones are
+        memoized so stepping back and forth or waiting doesn't recompute it.
+        """
+        key = (x, y, radius, self.transparency_version)
+        if key == self._fov_key:
+            GameMap.fov_skips += 1
+            return False
+
+        visible = self._fov_cache.get(key)
+        if visible is None:
+            GameMap.fov_computes += 1
+            visible = compute_fov(self.tiles["transparent"], (x, y), radius=radius)
+            self._fov_cache[key] = visible
+            if len(self._fov_cache) > FOV_CACHE_SIZE:
+                self._fov_cache.popitem(last=False)
+        else:
+            GameMap.fov_cache_hits += 1
+            self._fov_cache.move_to_end(key)
+
+        self._fov_key = key
+        # The cells entering or leaving the field of view, the newly explored ones are among them.
+        self._dirty |= self.visible != visible
+        self.visible[:] = visible
+        # If a tile is "visible" it should be added to "explored".
+        self.explored |= visible
+        return True
+
+    def _compute_path_cost(self, index: Union[Tuple[int, int], Tuple[slice, slice]]) -> np.ndarray:
+        blocked = self.blocking_ids[index] >= 0
+        return self.tiles["walkable"][index] * np.where(blocked, 1 + BLOCKING_ENTITY_COST, 1)
 
     def in_bounds(self, x: int, y: int) -> bool:
         """Return True if x and y are inside of the bounds of this map."""
         return 0 <= x < self.width and 0 <= y < self.height
 
+    def _glyph_arrays(self, render_order: RenderOrder) -> Tuple[np.ndarray, ...]:
+        """Return the x, y, glyph and color arrays of the entities of a render bucket."""
+        glyphs = self._glyphs[render_order]
+        if glyphs is None:
+            bucket = self._render_buckets[render_order]
+            glyphs = self._glyphs[render_order] = (
+                np.fromiter((entity.x for entity in bucket), dtype=np.intp, count=len(bucket)),
+                np.fromiter((entity.y for entity in bucket), dtype=np.intp, count=len(bucket)),
+                np.fromiter((ord(entity.char) for entity in bucket), dtype=np.int32, count=len(bucket)),
+                np.array([entity.color for entity in bucket], dtype=np.uint8).reshape(-1, 3),
+            )
+        return glyphs
+
+    def _compose_layer(self, index: Union[np.ndarray, Tuple[slice, slice]]) -> np.ndarray:
+        return np.select(
+            condlist=[self.visible[index], self.explored[index]],
+            choicelist=[self.tiles["light"][index], self.tiles["dark"][index]],
+            default=tile_types.SHROUD,
+        )
+
     def render(self, console: Console) -> None:
         """
         Renders the map.
@@ -96,18 +457,35 @@ class GameMap:
         If a tile is in the "visible" array, then draw it with the "light" colors.
         If it isn't, but it's in the "explored" array, then draw it with the "dark" colors.
         Otherwise, the default is "SHROUD".
+        Only the cells that changed since the last frame are composed again, the rest comes from the cached layer.
         """
-        console.rgb[0 : self.width, 0 : self.height] = np.select(
-            condlist=[self.visible, self.explored],
-            choicelist=[self.tiles["light"], self.tiles["dark"]],
-            default=tile_types.SHROUD,
-        )
-
-        entities_sorted_for_rendering = sorted(self.entities, key=lambda x: x.render_order.value)
-
-        for entity in entities_sorted_for_rendering:
-            if self.visible[entity.x, entity.y]:
-                console.print(x=entity.x, y=entity.y, string=entity.char, fg=entity.color)
+        dirty = self._dirty
+        if dirty.any():
+            self._layer[dirty] = self._compose_layer(dirty)
+            GameMap.layer_cells_rebuilt += int(np.count_nonzero(dirty))
+            dirty[:] = False
+        console.rgb[0 : self.width, 0 : self.height] = self._layer
+
+        # Corpses, then items, then actors, each bucket drawn at once on the visible tiles.
+        for render_order in RenderOrder:
+            xs, ys, chars, colors = self._glyph_arrays(render_order)
+            shown = self.visible[xs, ys]
+            xs, ys = xs[shown], ys[shown]
+            console.rgb["ch"][xs, ys] = chars[shown]
+            console.rgb["fg"][xs, ys] = colors[shown]
+
+
+def _ring_cells(center_x: int, center_y: int, ring: int) -> Iterator[Tuple[int, int]]:
+    """Yield the cells on the border of the square of the given radius around a cell."""
+    if ring == 0:
+        yield center_x, center_y
+        return
+    for x in range(center_x - ring, center_x + ring + 1):
+        yield x, center_y - ring
+        yield x, center_y + ring
+    for y in range(center_y - ring + 1, center_y + ring):
+        yield center_x - ring, y
+        yield center_x + ring, y
 
 
 class GameWorld:
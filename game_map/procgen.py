@@ -112,7 +112,7 @@ def place_entities(room: RectangularRoom, dungeon: GameMap, floor_number: int) -
         x = random.randint(room.x1 + 1, room.x2 - 1)
         y = random.randint(room.y1 + 1, room.y2 - 1)
 
-        if not any(entity.x == x and entity.y == y for entity in dungeon.entities):
+        if not dungeon.get_entities_at_location(x, y):
             entity.spawn(dungeon, x, y)
 
 
@@ -168,18 +168,18 @@ def generate_dungeon(
         # If there are no intersections then the room is valid.
 
         # Dig out this rooms inner area.
-        dungeon.tiles[new_room.inner] = tile_types.floor
+        dungeon.set_tiles(new_room.inner, tile_types.floor)
         
         #Create a chest in the room, if the total of chest is minor to the max number of chest
         if total_chest <= floor_values.max_chest_by_floor:
             x = random.randint(new_room.x1 + 1, new_room.x2 - 1)
             y = random.randint(new_room.y1 + 1, new_room.y2 - 1)
 
-            if not any (chest.x == x and chest.y == y for chest in dungeon.chests):
+            if not dungeon.get_chest_at_location(x, y):
                 if random.random() < 0.7:
                     pass
                 else:
-                    dungeon.tiles[x, y] = tile_types.chest
+                    dungeon.set_tiles((x, y), tile_types.chest)
                     entities.chest.spawn(gamemap=dungeon, x=x, y=y, item=get_chest_item_at_random(floor_values.chest_chances, floor=engine.game_world.current_floor))
                     total_chest += 1
 
@@ -189,13 +189,13 @@ def generate_dungeon(
         else:  # All rooms after the first.
             # Dig out a tunnel between this room and the previous one.
             for x, y in tunnel_between(rooms[-1].center, new_room.center):
-                dungeon.tiles[x, y] = tile_types.floor
+                dungeon.set_tiles((x, y), tile_types.floor)
 
             center_of_last_room = new_room.center
 
         place_entities(new_room, dungeon, engine.game_world.current_floor)
 
-        dungeon.tiles[center_of_last_room] = tile_types.down_stairs
+        dungeon.set_tiles(center_of_last_room, tile_types.down_stairs)
         dungeon.downstairs_location = center_of_last_room
 
         # Finally, append the new room to the list.
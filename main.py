@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+from typing import Dict
+import argparse
 import traceback
 
 import tcod
@@ -6,8 +8,13 @@ import tcod
 import game_map.color as color
 import utility_files.exceptions as exceptions
 import actions_logic.input_handlers as input_handlers
+from actions_logic.input_queue import InputQueue
 import game_logic.setup_game as setup_game
-from utility_files.utility import resource_path
+import utility_files.tracing as tracing
+from utility_files.utility import DEBUG, resource_path
+
+# Number of loop iterations that rendered a frame, and that skipped it because nothing changed.
+frame_counters: Dict[str, int] = {"rendered": 0, "skipped": 0}
 
 
 def save_game(handler: input_handlers.BaseEventHandler, filename: str) -> None:
@@ -18,6 +25,13 @@ def save_game(handler: input_handlers.BaseEventHandler, filename: str) -> None:
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--trace", action="store_true", help=f"Trace the turns, F12 saves the last ones to {tracing.TRACE_FILE}."
+    )
+    if parser.parse_args().trace:
+        tracing.enable()
+
     screen_width = 80
     screen_height = 50
 
@@ -33,21 +47,35 @@ def main() -> None:
         vsync=True,
     ) as context:
         root_console = tcod.console.Console(screen_width, screen_height, order="F")
+        rendered_handler = None
+        input_queue = InputQueue()
         try:
             while True:
-                root_console.clear()
-                handler.on_render(console=root_console)
-                context.present(root_console)
+                # Only render when the handler changed, or something changed what it shows.
+                if handler is not rendered_handler or handler.dirty:
+                    with tracing.span("render", handler=type(handler).__name__):
+                        root_console.clear()
+                        handler.on_render(console=root_console)
+                        context.present(root_console)
+                    input_queue.presented()
+                    handler.dirty = False
+                    rendered_handler = handler
+                    frame_counters["rendered"] += 1
+                else:
+                    frame_counters["skipped"] += 1
 
                 try:
-                    for event in tcod.event.wait():
+                    for event in input_queue.filter(tcod.event.wait()):
                         context.convert_event(event)
                         handler = handler.handle_events(event)
+                        if isinstance(handler, input_handlers.EventHandler) and handler.engine.take_input_interrupt():
+                            input_queue.interrupt()
                 except Exception:  # Handle exceptions in game.
                     traceback.print_exc()  # Print error to stderr.
                     # Then print the error to the message log.
                     if isinstance(handler, input_handlers.EventHandler):
                         handler.engine.message_log.add_message(traceback.format_exc(), color.error)
+                    handler.dirty = True
         except exceptions.QuitWithoutSaving:
             raise
         except SystemExit:  # Save and quit.
@@ -56,6 +84,17 @@ def main() -> None:
         except BaseException:  # Save on any other unexpected exception.
             save_game(handler, "savegame.sav")
             raise
+        finally:
+            if isinstance(handler, input_handlers.EventHandler):
+                handler.engine.message_log.close()  # The save, if any, holds a copy of the spilled messages.
+            if DEBUG:
+                print(f"Frames rendered: {frame_counters['rendered']}, skipped: {frame_counters['skipped']}")
+                if input_queue.latencies:
+                    latencies = sorted(input_queue.latencies)
+                    print(
+                        f"Input to present latency: median {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+                        f"max {latencies[-1] * 1000:.1f} ms, {input_queue.dropped_repeats} key repeats dropped"
+                    )
 
 
 if __name__ == "__main__":
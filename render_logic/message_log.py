@@ -1,4 +1,10 @@
-from typing import Iterable, List, Reversible, Tuple
+from array import array
+from collections import deque
+from typing import BinaryIO, Deque, Iterable, Iterator, List, Optional, Reversible, Tuple
+import itertools
+import json
+import os
+import tempfile
 import textwrap
 
 import tcod
@@ -7,10 +13,15 @@ import game_map.color as color
 
 
 class Message:
+    __slots__ = ("plain_text", "fg", "count", "_wrapped", "_wrapped_key")
+
     def __init__(self, text: str, fg: Tuple[int, int, int]):
         self.plain_text = text
         self.fg = fg
         self.count = 1
+        # Lines of the full text as last wrapped, for the (width, count) they were wrapped with.
+        self._wrapped: List[str] = []
+        self._wrapped_key: Optional[Tuple[int, int]] = None
 
     @property
     def full_text(self) -> str:
@@ -19,10 +30,69 @@ class Message:
             return f"{self.plain_text} (x{self.count})"
         return self.plain_text
 
+    def wrapped(self, width: int) -> List[str]:
+        """Return the full text wrapped to `width`, only wrapping it again when the width or the count changed."""
+        key = (width, self.count)
+        if self._wrapped_key != key:
+            self._wrapped = list(MessageLog.wrap(self.full_text, width))
+            self._wrapped_key = key
+        return self._wrapped
+
+
+class MessageHistory:
+    """The first `end` messages of a log, iterated from the newest, the spilled ones are read from disk lazily."""
+
+    def __init__(self, log: "MessageLog", end: int):
+        self.log = log
+        self.end = end
+
+    def __reversed__(self) -> Iterator[Message]:
+        log = self.log
+        spilled = len(log.spill_offsets)
+        in_memory = self.end - spilled
+        if in_memory > 0:
+            yield from itertools.islice(reversed(log.messages), len(log.messages) - in_memory, None)
+        yield from log.read_spilled(range(min(self.end, spilled) - 1, -1, -1))
+
 
 class MessageLog:
-    def __init__(self) -> None:
-        self.messages: List[Message] = []
+    """The messages of a game, the last `capacity` ones are kept in memory, the older ones are spilled to disk."""
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self.messages: Deque[Message] = deque(maxlen=capacity)
+        # Anonymous temporary file of the messages pushed out of memory, one JSON line each, and the offset of
+        # each line. The file has no name on disk, it's gone once closed, saves embed its content.
+        self.spill_offsets = array("q")
+        self._spill_file: Optional[BinaryIO] = None
+        self.warning_logged = False  # Set by messages in one of color.warnings, see Engine.take_input_interrupt.
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        del state["_spill_file"]
+        state["spilled"] = b""
+        if self._spill_file is not None:
+            self._spill_file.seek(0)
+            state["spilled"] = self._spill_file.read()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        spilled = state.pop("spilled")
+        self.__dict__.update(state)
+        self._spill_file = None
+        if spilled:
+            self._spill_file = tempfile.TemporaryFile()
+            self._spill_file.write(spilled)
+
+    def close(self) -> None:
+        """Delete the spilled messages, once the game is over."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        self.spill_offsets = array("q")
+
+    def __len__(self) -> int:
+        """Number of messages of this log, including the spilled ones."""
+        return len(self.spill_offsets) + len(self.messages)
 
     def add_message(self, text: str, fg: Tuple[int, int, int] = color.white, *, stack: bool = True) -> None:
         """Add a message to this log.
@@ -32,11 +102,37 @@ class MessageLog:
         If `stack` is True then the message can stack with a previous message
         of the same text.
         """
+        if fg in color.warnings:
+            self.warning_logged = True
         if stack and self.messages and text == self.messages[-1].plain_text:
             self.messages[-1].count += 1
         else:
+            if len(self.messages) == self.messages.maxlen:
+                self._spill(self.messages[0])
             self.messages.append(Message(text, fg))
 
+    def _spill(self, message: Message) -> None:
+        if self._spill_file is None:
+            self._spill_file = tempfile.TemporaryFile()
+        self.spill_offsets.append(self._spill_file.seek(0, os.SEEK_END))
+        self._spill_file.write(json.dumps([message.plain_text, message.fg, message.count]).encode() + b"\n")
+
+    def read_spilled(self, indices: Iterable[int]) -> Iterator[Message]:
+        """Read the spilled messages at the given indices from disk."""
+        spill_file = self._spill_file
+        for index in indices:
+            if spill_file.closed:
+                return  # The log was closed while iterating.
+            spill_file.seek(self.spill_offsets[index])
+            text, fg, count = json.loads(spill_file.readline())
+            message = Message(text, tuple(fg))
+            message.count = count
+            yield message
+
+    def history(self, end: int) -> MessageHistory:
+        """Return the first `end` messages of this log, for render_messages."""
+        return MessageHistory(self, end)
+
     def render(self, console: tcod.console.Console, x: int, y: int, width: int, height: int) -> None:
         """Render this log over the given area.
 
@@ -67,7 +163,7 @@ class MessageLog:
         y_offset = height - 1
 
         for message in reversed(messages):
-            for line in reversed(list(cls.wrap(message.full_text, width))):
+            for line in reversed(message.wrapped(width)):
                 console.print(x=x, y=y + y_offset, string=line, fg=message.fg)
                 y_offset -= 1
                 if y_offset < 0:
@@ -0,0 +1,47 @@
+import random
+import unittest
+
+import numpy as np
+
+from components.condition_types import Condition
+from entity.entity_factories import entities
+from game_logic.activation import ActivationTier
+from game_logic.engine import Engine
+from game_map.game_map import GameMap
+import game_map.tile_types as tile_types
+
+
+class DriftingConditionsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        random.seed(0)
+        player = entities.player.clone()
+        self.engine = Engine(player=player)
+        self.engine.game_map = GameMap(self.engine, 80, 40)
+        self.engine.game_map.set_tiles(np.s_[1:-1, 1:-1], tile_types.floor)
+        player.place(10, 20, self.engine.game_map)
+        self.engine.update_fov(radius=8)
+
+        # Between the wake and drift radius, out of sight.
+        self.orc = entities.meelee_orc.spawn(self.engine.game_map, 30, 20)
+        self.orc.ai.last_known_position = None
+
+    def test_drifting_actor_takes_no_condition_damage(self) -> None:
+        orc = self.orc
+        self.assertIs(self.engine.activation.tier_of(self.engine, orc), ActivationTier.DRIFTING)
+        self.assertFalse(self.engine.game_map.visible[orc.x, orc.y])
+        orc.status.afflict(Condition.POISON)
+        orc.status.afflict(Condition.CHARM)
+        hp = orc.fighter.hp
+        messages = len(self.engine.message_log)
+
+        for _ in range(20):
+            self.engine.activation.perform(self.engine, orc)
+
+        self.assertEqual(orc.fighter.hp, hp)
+        self.assertEqual(len(self.engine.message_log), messages)
+        self.assertEqual(orc.status.turns_passed(Condition.POISON), 0)
+        self.assertEqual(orc.status.turns_passed(Condition.CHARM), 20)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,123 @@
+"""Opt-in tracing of the turns, exported as Chrome trace events to open in chrome://tracing or Perfetto.
+
+Start the game with --trace, or set ROGUELIKE_TRACE=1, then press F12 to save the last spans to trace.json.
+The spans are kept in a ring buffer, so a long game only keeps its last BUFFER_SIZE spans.
+
+Code marks a span with `with tracing.span(name, **attributes)`, which is a shared no-op while tracing is off.
+Methods registered with instrument, like every Action.perform, are only wrapped while tracing is on, so they
+cost nothing otherwise.
+"""
+from __future__ import annotations
+
+from collections import deque
+from contextlib import nullcontext
+from time import perf_counter_ns
+from typing import Any, Callable, ContextManager, Deque, Dict, List, Tuple
+import functools
+import json
+import os
+
+BUFFER_SIZE = 100_000
+TRACE_FILE = "trace.json"
+
+enabled = False
+# (name, category, start, duration, attributes) of the last spans, in nanoseconds.
+events: Deque[Tuple[str, str, int, int, Dict[str, Any]]] = deque(maxlen=BUFFER_SIZE)
+
+# Class, method name, category and attribute function of the instrumented methods.
+_instrumented: List[Tuple[type, str, str, Callable[..., Dict[str, Any]]]] = []
+
+_NO_SPAN = nullcontext()
+
+
+class _Span:
+    __slots__ = ("name", "category", "attributes", "start")
+
+    def __init__(self, name: str, category: str, attributes: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.attributes = attributes
+
+    def __enter__(self) -> _Span:
+        self.start = perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        events.append((self.name, self.category, self.start, perf_counter_ns() - self.start, self.attributes))
+
+
+def span(name: str, category: str = "game", **attributes: Any) -> ContextManager:
+    """Return a context manager recording the time spent in its block, if tracing is on."""
+    if not enabled:
+        return _NO_SPAN
+    return _Span(name, category, attributes)
+
+
+def _wrap(cls: type, method: str, category: str, describe: Callable[..., Dict[str, Any]]) -> None:
+    function = cls.__dict__[method]
+    name = f"{cls.__name__}.{method}"
+
+    @functools.wraps(function)
+    def traced(*args: Any, **kwargs: Any) -> Any:
+        start = perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            events.append((name, category, start, perf_counter_ns() - start, describe(*args, **kwargs)))
+
+    traced.untraced = function  # type: ignore[attr-defined]
+    setattr(cls, method, traced)
+
+
+def instrument(cls: type, method: str, category: str, describe: Callable[..., Dict[str, Any]]) -> None:
+    """Trace the calls of a method defined by a class while tracing is on.
+
+    `describe` takes the arguments of the method, self included, and returns the attributes of the span.
+    """
+    _instrumented.append((cls, method, category, describe))
+    if enabled:
+        _wrap(cls, method, category, describe)
+
+
+def enable() -> None:
+    global enabled
+    if not enabled:
+        enabled = True
+        for cls, method, category, describe in _instrumented:
+            _wrap(cls, method, category, describe)
+
+
+def disable() -> None:
+    global enabled
+    if enabled:
+        enabled = False
+        for cls, method, _, _ in _instrumented:
+            setattr(cls, method, cls.__dict__[method].untraced)
+
+
+def dump(filename: str = TRACE_FILE) -> int:
+    """Save the spans of the buffer as Chrome trace events, and return how many there were."""
+    pid = os.getpid()
+    trace = {
+        "displayTimeUnit": "ms",
+        "traceEvents": [
+            {
+                "name": name,
+                "cat": category,
+                "ph": "X",  # Complete event, with a start and a duration.
+                "ts": start / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": 0,
+                "args": attributes,
+            }
+            for name, category, start, duration, attributes in events
+        ],
+    }
+    with open(filename, "w") as f:
+        json.dump(trace, f, default=str)
+    return len(trace["traceEvents"])
+
+
+if os.environ.get("ROGUELIKE_TRACE") == "1":
+    enable()
@@ -1,9 +1,34 @@
+from typing import Tuple, TypeVar
+import functools
 import os, sys
 
+T = TypeVar("T")
+
+# Set ROGUELIKE_DEBUG=1 to run the expensive consistency checks after every turn.
+DEBUG = bool(os.environ.get("ROGUELIKE_DEBUG"))
+
 def resource_path(relative_path):
     try:
         base_path = sys._MEIPASS
     except Exception:
         base_path = os.path.abspath(".")
     
-    return os.path.join(base_path, relative_path)
\ No newline at end of file
+    return os.path.join(base_path, relative_path)
+
+
+@functools.lru_cache(maxsize=None)
+def slot_names(cls: type) -> Tuple[str, ...]:
+    """Return the names of the __slots__ of a class and of its bases."""
+    return tuple(name for klass in reversed(cls.__mro__) for name in klass.__dict__.get("__slots__", ()))
+
+
+def shallow_clone(source: T, skip: Tuple[str, ...] = ("parent",)) -> T:
+    """Return a new instance of a slotted class sharing every attribute of `source` but the `skip` ones."""
+    clone = object.__new__(type(source))
+    for name in slot_names(type(source)):
+        if name not in skip:
+            try:
+                setattr(clone, name, getattr(source, name))
+            except AttributeError:
+                pass  # Not set on the source either.
+    return clone